@@ -0,0 +1,130 @@
+import os
+import hashlib
+import sqlite3
+import pandas as pd
+from parallel_update import DEFAULT_CHUNK_SIZE
+from sentiment_aggregation import (SUM_COLUMNS, sentiment_partial_sums, resample_partial_sums,
+                                   sentiment_frame_from_sums, period_starts)
+from streaming_pipeline import stream_sentiment_sums, complete_rows_end, DEFAULT_READ_ROWS
+
+DEFAULT_STORE_PATH = '../../output_data/sentiment_aggregates/sentiment_aggregates.sqlite'
+INTEGER_COLUMNS = ['tweets', 'positive_sentiment', 'negative_sentiment', 'neutral_sentiment',
+                   'scored_tweets']
+
+
+class SentimentAggregateStore:
+    def __init__(self, path=DEFAULT_STORE_PATH, frequency='daily'):
+        self.frequency = frequency
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS sums (dataset TEXT NOT NULL, date TEXT NOT NULL, %s, '
+                'PRIMARY KEY (dataset, date)) WITHOUT ROWID'
+                % ', '.join('%s %s NOT NULL' % (column, 'INTEGER' if column in INTEGER_COLUMNS else 'REAL')
+                            for column in SUM_COLUMNS))
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS sources (dataset TEXT NOT NULL, source TEXT NOT NULL, '
+                'offset INTEGER NOT NULL, fingerprint TEXT NOT NULL, PRIMARY KEY (dataset, source)) WITHOUT ROWID')
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def datasets(self):
+        return [row[0] for row in self.connection.execute('SELECT DISTINCT dataset FROM sums ORDER BY dataset')]
+
+    def clear(self, dataset):
+        with self.connection:
+            self.connection.execute('DELETE FROM sums WHERE dataset = ?', (dataset,))
+            self.connection.execute('DELETE FROM sources WHERE dataset = ?', (dataset,))
+
+    def add_sums(self, dataset, sums, source=None, offset=None, fingerprint=None):
+        sums = resample_partial_sums(sums, self.frequency)
+        dates = sums.index.strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(dataset, date) + tuple(int(row[column]) if column in INTEGER_COLUMNS else float(row[column])
+                                        for column in SUM_COLUMNS)
+                for date, (_, row) in zip(dates, sums.iterrows())]
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO sums (dataset, date, %s) VALUES (?, ?, %s) ON CONFLICT (dataset, date) DO UPDATE SET %s'
+                % (', '.join(SUM_COLUMNS), ', '.join('?' * len(SUM_COLUMNS)),
+                   ', '.join('%s = %s + excluded.%s' % (column, column, column) for column in SUM_COLUMNS)),
+                rows)
+            if source is not None:
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO sources (dataset, source, offset, fingerprint) VALUES (?, ?, ?, ?)',
+                    (dataset, source, offset, fingerprint))
+        return len(rows)
+
+    def add_tweets(self, dataset, scored_tweets):
+        return self.add_sums(dataset, sentiment_partial_sums(scored_tweets, self.frequency))
+
+    def source_position(self, dataset, source):
+        row = self.connection.execute(
+            'SELECT offset, fingerprint FROM sources WHERE dataset = ? AND source = ?',
+            (dataset, source)).fetchone()
+        if row is None:
+            return 0, None
+        return row
+
+    def partial_sums(self, dataset, start=None, end=None):
+        query = 'SELECT date, %s FROM sums WHERE dataset = ?' % (', '.join(SUM_COLUMNS))
+        parameters = [dataset]
+        if start is not None:
+            query += ' AND date >= ?'
+            parameters.append(pd.Timestamp(start).strftime('%Y-%m-%d %H:%M:%S'))
+        if end is not None:
+            query += ' AND date <= ?'
+            parameters.append(pd.Timestamp(end).strftime('%Y-%m-%d %H:%M:%S'))
+        sums = pd.read_sql_query(query + ' ORDER BY date', self.connection, params=parameters)
+        sums.index = pd.to_datetime(sums.pop('date'))
+        sums.index.name = 'date'
+        return sums[SUM_COLUMNS]
+
+    def check_frequency(self, frequency):
+        starts = period_starts(pd.date_range('2020-01-01', '2021-01-01', freq='min'), self.frequency).unique()
+        ends = starts[1:] - pd.Timedelta(1, 'ns')
+        if not (period_starts(starts[:-1], frequency) == period_starts(ends, frequency)).all():
+            raise ValueError('%s sentiment cannot be read from a store of %s sums' % (frequency, self.frequency))
+
+    def sentiment_frame(self, dataset, frequency=None, start=None, end=None):
+        if frequency is not None:
+            self.check_frequency(frequency)
+        sums = self.partial_sums(dataset, start, end)
+        if frequency is not None:
+            sums = resample_partial_sums(sums, frequency)
+        return sentiment_frame_from_sums(sums)
+
+FINGERPRINT_BYTES = 4096
+
+
+def source_fingerprint(raw_csv_path, offset):
+    with open(raw_csv_path, 'rb') as raw_csv:
+        header = raw_csv.readline()
+        start = max(offset - FINGERPRINT_BYTES, 0)
+        raw_csv.seek(start)
+        tail = raw_csv.read(offset - start)
+    return hashlib.blake2b(header + b'\x00' + tail, digest_size=16).hexdigest()
+
+
+def update_from_raw_csv(store, dataset, raw_csv_path, read_rows=DEFAULT_READ_ROWS, workers=1,
+                        chunk_size=DEFAULT_CHUNK_SIZE, cache=None, language='en', rebuild=False):
+    source = os.path.abspath(raw_csv_path)
+    offset, fingerprint = store.source_position(dataset, source)
+    size = os.path.getsize(raw_csv_path)
+    if size < offset or (offset and source_fingerprint(raw_csv_path, offset) != fingerprint):
+        if not rebuild:
+            raise ValueError('%s has changed since it was last added to %s, clear the dataset and add it again'
+                             % (raw_csv_path, dataset))
+        store.clear(dataset)
+        offset = 0
+    end = complete_rows_end(raw_csv_path, offset, size)
+    if end == offset:
+        return 0
+    sums = stream_sentiment_sums(raw_csv_path, read_rows, workers, chunk_size, cache, language,
+                                 store.frequency, offset, end)
+    store.add_sums(dataset, sums, source, end, source_fingerprint(raw_csv_path, end))
+    return int(sums['scored_tweets'].sum())
@@ -0,0 +1,171 @@
+import os
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+from sentiment_aggregation import sentiment_frame, sentiment_frame_from_sums, text_counted
+from sentiment_scoring import sentiment_labels
+from streaming_pipeline import stream_sentiment_sums
+from aggregate_store import SentimentAggregateStore, update_from_raw_csv
+from timeline_scraper import combine_windows, window_path
+from synthetic_tweets import synthetic_tweets, write_synthetic_csv
+from live_sentiment import SentimentWindow
+
+def legacy_sentiment_frame(raw_tweet_data):
+    count_df = raw_tweet_data.groupby(
+        'date')['Clean_Tweet'].count().reset_index(name='tweets')
+    count_df['date'] = pd.to_datetime(count_df['date'])
+    count_df = count_df.set_index('date')
+    positive_df = raw_tweet_data.groupby('date')['Sentiment'].apply(
+        lambda x: (x == 'Positive').sum()).reset_index(name='positive_sentiment')
+    positive_df['date'] = pd.to_datetime(positive_df['date'])
+    positive_df = positive_df.set_index('date')
+    negative_df = raw_tweet_data.groupby('date')['Sentiment'].apply(
+        lambda x: (x == 'Negative').sum()).reset_index(name='negative_sentiment')
+    negative_df['date'] = pd.to_datetime(negative_df['date'])
+    negative_df = negative_df.set_index('date')
+    neutral_df = raw_tweet_data.groupby('date')['Sentiment'].apply(
+        lambda x: (x == 'Neutral').sum()).reset_index(name='neutral_sentiment')
+    neutral_df['date'] = pd.to_datetime(neutral_df['date'])
+    neutral_df = neutral_df.set_index('date')
+
+    average_polarity_df = raw_tweet_data.groupby(
+        'date')['Polarity'].mean().reset_index(name='average_polarity')
+    average_polarity_df['date'] = pd.to_datetime(average_polarity_df['date'])
+    average_polarity_df = average_polarity_df.set_index('date')
+
+    average_subjectivity_df = raw_tweet_data.groupby(
+        'date')['Subjectivity'].mean().reset_index(name='average_subjectivity')
+    average_subjectivity_df['date'] = pd.to_datetime(
+        average_subjectivity_df['date'])
+    average_subjectivity_df = average_subjectivity_df.set_index('date')
+
+    sentiment_df = pd.concat([count_df, positive_df, negative_df,
+                              neutral_df, average_polarity_df, average_subjectivity_df], axis=1)
+    sentiment_df['positive_percentage'] = (sentiment_df.positive_sentiment /
+                                           sentiment_df.tweets)
+    sentiment_df['negative_percentage'] = (
+        sentiment_df.negative_sentiment / sentiment_df.tweets)
+    sentiment_df['objective'] = (sentiment_df.positive_sentiment +
+                                 sentiment_df.negative_sentiment) / (sentiment_df.tweets)
+    sentiment_df['neutral'] = (1 - sentiment_df.objective)
+    return sentiment_df
+
+def synthetic_scored_tweets(rows, seed=0):
+    generator = np.random.default_rng(seed)
+    days = pd.date_range('2018-01-01', '2021-08-01', freq='D').strftime('%Y-%m-%d')
+    polarity = np.round(generator.uniform(-1, 1, rows), 4)
+    polarity[generator.random(rows) < 0.35] = 0.0
+    times = (pd.Timestamp(0) + pd.to_timedelta(np.arange(0, 86400, 60), unit='s')).strftime('%H:%M:%S')
+    texts = np.array(['bitcoin to the moon', 'cardano staking update', 'sell now', np.nan],
+                     dtype=object)
+    return pd.DataFrame({
+        'date': np.asarray(days, dtype=object)[generator.integers(0, len(days), rows)],
+        'time': np.asarray(times, dtype=object)[generator.integers(0, len(times), rows)],
+        'Clean_Tweet': texts[generator.choice(len(texts), rows, p=[0.33, 0.33, 0.33, 0.01])],
+        'Subjectivity': np.round(generator.uniform(0, 1, rows), 4),
+        'Polarity': polarity,
+        'Sentiment': sentiment_labels(polarity),
+    })
+
+def timed(function, *arguments):
+    start = time.perf_counter()
+    result = function(*arguments)
+    return time.perf_counter() - start, result
+
+
+def largest_difference(first_df, second_df):
+    return float(np.nanmax(np.abs(first_df.to_numpy(dtype=float) -
+                                  second_df.to_numpy(dtype=float))))
+
+
+def run_benchmark(rows=10000000, repeats=3):
+    scored_tweets = synthetic_scored_tweets(rows)
+    legacy_seconds, legacy_df = min(
+        (timed(legacy_sentiment_frame, scored_tweets) for repeat in range(repeats)),
+        key=lambda timing: timing[0])
+    single_pass_seconds, single_pass_df = min(
+        (timed(sentiment_frame, scored_tweets) for repeat in range(repeats)),
+        key=lambda timing: timing[0])
+    results = {
+        'rows': rows,
+        'dates': len(single_pass_df.index),
+        'six_groupby_seconds': round(legacy_seconds, 3),
+        'single_pass_seconds': round(single_pass_seconds, 3),
+        'speedup': round(legacy_seconds / single_pass_seconds, 1),
+        'same_dates': bool(legacy_df.index.equals(single_pass_df.index)),
+        'largest_difference': largest_difference(legacy_df, single_pass_df),
+    }
+    for frequency in ['hourly', 'weekly', 'monthly']:
+        seconds, frequency_df = timed(sentiment_frame, scored_tweets, frequency)
+        results['%s_seconds' % (frequency)] = round(seconds, 3)
+    return results
+
+def frequency_check(rows=100000, frequencies=('6h', '2D', 'MS', 'QS')):
+    scored_tweets = synthetic_scored_tweets(rows)
+    timestamps = pd.to_datetime(scored_tweets['date']) + pd.to_timedelta(scored_tweets['time'])
+    counted = pd.Series(text_counted(scored_tweets['Clean_Tweet']).astype(int), index=timestamps)
+    results = {}
+    for frequency in frequencies:
+        tweets = sentiment_frame(scored_tweets, frequency)['tweets']
+        expected = counted.resample(frequency).sum()[counted.resample(frequency).count() > 0]
+        results[frequency] = bool(tweets.index.equals(expected.index) and
+                                  np.array_equal(tweets.to_numpy(), expected.to_numpy()))
+    return results
+
+def combine_and_update(store, windows, extended_path, directory):
+    combine_windows('bitcoin', windows, extended_path, directory)
+    added = update_from_raw_csv(store, 'bitcoin_extended', extended_path, rebuild=True)
+    stored_df = store.sentiment_frame('bitcoin_extended')
+    expected_df = sentiment_frame_from_sums(stream_sentiment_sums(extended_path))
+    return {
+        'added': added,
+        'same_dates': bool(stored_df.index.equals(expected_df.index)),
+        'largest_difference': largest_difference(stored_df, expected_df),
+    }
+
+
+def rewrite_check(rows=2000):
+    windows = [('2021-01-01', '2021-01-02'), ('2021-02-01', '2021-02-02'), ('2021-03-01', '2021-03-02')]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        extended_path = os.path.join(directory, 'bitcoin_tweets_results_extended.csv')
+        store = SentimentAggregateStore(os.path.join(directory, 'sentiment_aggregates.sqlite'))
+        try:
+            for seed, (since, until) in enumerate(windows):
+                write_synthetic_csv(window_path('bitcoin', since, directory), rows, seed)
+            results['combined'] = combine_and_update(store, windows, extended_path, directory)
+            synthetic_tweets(rows // 10, seed=3).to_csv(window_path('bitcoin', windows[-1][0], directory),
+                                                        mode='a', header=False, index=False)
+            results['added_to'] = combine_and_update(store, windows, extended_path, directory)
+            write_synthetic_csv(window_path('bitcoin', windows[0][0], directory), rows, seed=4)
+            results['rewritten'] = combine_and_update(store, windows, extended_path, directory)
+        finally:
+            store.close()
+    return results
+
+GAP_TWEETS = ['2021-03-01 00:00:00', '2021-03-01 00:30:00', '2021-03-01 03:00:00']
+
+
+def window_check(tweet_times, length, step=None):
+    seconds = [int(pd.Timestamp(tweet_time).timestamp()) for tweet_time in sorted(tweet_times)]
+    window = SentimentWindow(length, step, history=len(seconds) * 1440 + 1)
+    for tweet_seconds in seconds:
+        window.add(tweet_seconds, 0.0, 0.0, True)
+    step, length = int(window.step), int(window.length)
+    first_bucket = seconds[0] - seconds[0] % step
+    last_bucket = seconds[-1] - seconds[-1] % step
+    expected = {}
+    for start in range(first_bucket + step - length, last_bucket + step - length + 1, step):
+        tweets = sum(start <= tweet_seconds < start + length for tweet_seconds in seconds)
+        if tweets:
+            expected[pd.to_datetime(start, unit='s')] = tweets
+    counts = window.frame()['tweets']
+    return {'windows': len(expected), 'same_windows': counts.to_dict() == expected}
+
+
+if __name__ == "__main__":
+    print(run_benchmark())
+    print("Frequency check ", frequency_check())
+    print("Rewrite check ", rewrite_check())
+    print("Window check ", window_check(GAP_TWEETS, 'h', '1min'))
@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import time
+import platform
+import tempfile
+import subprocess
+import numpy as np
+import pandas as pd
+from synthetic_tweets import synthetic_tweet_chunks, DEFAULT_CHUNK_SIZE
+from tweet_cleaning import clean_tweets
+from sentiment_scoring import score_tweets
+from sentiment_aggregation import sentiment_partial_sums, combine_partial_sums, sentiment_frame_from_sums
+from sentiment_plots_final import polarity_hist, objec_neut_bar, tweet_volume_graph
+from instrumentation import MemorySampler
+
+class BenchmarkStages:
+    def __init__(self):
+        self.stages = {}
+
+    def measure(self, name, function, *arguments, rows=None):
+        with MemorySampler() as sampler:
+            start = time.perf_counter()
+            result = function(*arguments)
+            seconds = time.perf_counter() - start
+        stage = self.stages.setdefault(name, {'rows': 0, 'calls': 0, 'seconds': 0.0, 'peak_memory': 0})
+        stage['rows'] += len(result) if rows is None else rows
+        stage['calls'] += 1
+        stage['seconds'] += seconds
+        stage['peak_memory'] = max(stage['peak_memory'], sampler.peak)
+        return result
+
+    def report(self):
+        return {name: {'rows': stage['rows'],
+                       'calls': stage['calls'],
+                       'seconds': round(stage['seconds'], 4),
+                       'seconds_per_call': round(stage['seconds'] / stage['calls'], 4),
+                       'rows_per_second': round(stage['rows'] / stage['seconds']) if stage['seconds'] > 0 else None,
+                       'peak_memory_mb': round(stage['peak_memory'] / 2**20, 1)}
+                for name, stage in self.stages.items()}
+
+PLOT_FOLDERS = ['polarity', 'objectivity', 'tweet_volume']
+
+
+def scored_chunk(chunk, stages):
+    english = chunk[chunk['language'] == 'en'].reset_index(drop=True)
+    clean = stages.measure('clean', clean_tweets, english['tweet'])
+    scores = stages.measure('score', score_tweets, clean)
+    return pd.DataFrame({'date': english['date'], 'Clean_Tweet': clean, 'Subjectivity': scores['Subjectivity'],
+                         'Polarity': scores['Polarity'], 'Sentiment': scores['Sentiment']})
+
+
+def plot_charts(polarity, sentiment_df):
+    current_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        for folder in PLOT_FOLDERS:
+            os.makedirs(os.path.join(directory, 'output_data', 'plots', folder))
+        os.makedirs(os.path.join(directory, 'code', 'benchmark'))
+        os.chdir(os.path.join(directory, 'code', 'benchmark'))
+        try:
+            polarity_hist(pd.DataFrame({'Polarity': polarity}), "extended", "benchmark")
+            objec_neut_bar(sentiment_df.reset_index(), "extended", "benchmark")
+            tweet_volume_graph(pd.DataFrame({'Date': sentiment_df.index, 'Tweets': sentiment_df.tweets.to_numpy()}),
+                               "extended", "benchmark")
+        finally:
+            os.chdir(current_directory)
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(rows, seed=0, chunk_size=DEFAULT_CHUNK_SIZE):
+    stages = BenchmarkStages()
+    start = time.perf_counter()
+    chunks = synthetic_tweet_chunks(rows, seed, chunk_size, ['date', 'tweet', 'language'])
+    partial_sums = []
+    polarity = []
+    for chunk_start in range(0, rows, chunk_size):
+        chunk = stages.measure('generate', next, chunks)
+        scored_tweets = scored_chunk(chunk, stages)
+        partial_sums.append(stages.measure('aggregate', sentiment_partial_sums, scored_tweets,
+                                           rows=len(scored_tweets.index)))
+        polarity.append(scored_tweets['Polarity'].to_numpy())
+    sentiment_df = stages.measure('aggregate', sentiment_frame_from_sums,
+                                  combine_partial_sums(partial_sums), rows=0)
+    polarity = np.concatenate(polarity)
+    stages.measure('plot', plot_charts, polarity, sentiment_df, rows=len(polarity))
+    return {'run': pd.Timestamp.now(tz='UTC').isoformat(timespec='seconds'),
+            'commit': current_commit(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'rows': rows,
+            'seed': seed,
+            'chunk_size': chunk_size,
+            'stages': stages.report(),
+            'total_seconds': round(time.perf_counter() - start, 3)}
+
+BENCHMARK_RESULTS = '../../output_data/benchmarks/benchmark_results.jsonl'
+REGRESSION_TOLERANCE = 0.2
+
+
+def save_result(result, results_path=BENCHMARK_RESULTS):
+    os.makedirs(os.path.dirname(results_path), exist_ok=True)
+    with open(results_path, 'a') as results_file:
+        results_file.write(json.dumps(result) + '\n')
+
+
+def load_results(results_path=BENCHMARK_RESULTS):
+    if not os.path.exists(results_path):
+        return []
+    with open(results_path) as results_file:
+        return [json.loads(line) for line in results_file if line.strip()]
+
+
+def previous_result(results, result):
+    for previous in reversed(results):
+        if all(previous[key] == result[key] for key in ['rows', 'seed', 'chunk_size']):
+            return previous
+    return None
+
+
+def regressions(previous, result, tolerance=REGRESSION_TOLERANCE):
+    found = []
+    if previous is None:
+        return found
+    for name, stage in result['stages'].items():
+        before = previous['stages'].get(name)
+        if before is None:
+            continue
+        if before['rows_per_second'] and stage['rows_per_second'] is not None and \
+                stage['rows_per_second'] < before['rows_per_second'] * (1 - tolerance):
+            found.append('%s: %s rows/s, was %s' % (name, stage['rows_per_second'], before['rows_per_second']))
+        if stage['peak_memory_mb'] > before['peak_memory_mb'] * (1 + tolerance):
+            found.append('%s: %s MB peak memory, was %s' % (name, stage['peak_memory_mb'], before['peak_memory_mb']))
+    return found
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+
+if __name__ == "__main__":
+    SIZES = [int(size) for size in sys.argv[1:]] or DEFAULT_SIZES
+    for rows in SIZES:
+        result = run_suite(rows)
+        previous = previous_result(load_results(), result)
+        save_result(result)
+        print("Benchmark ", json.dumps(result, indent=1))
+        print("Regressions ", regressions(previous, result))
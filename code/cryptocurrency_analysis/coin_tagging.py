@@ -0,0 +1,118 @@
+import re
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from parallel_update import clean_and_score_tweets, DEFAULT_CHUNK_SIZE
+from sentiment_aggregation import sentiment_partial_sums, combine_partial_sums, sentiment_frame_from_sums, intraday
+from streaming_pipeline import raw_tweet_chunks, RAW_COLUMNS, DEFAULT_READ_ROWS
+from tweet_cleaning import TWEET_SEPARATOR
+from instrumentation import instrumented
+
+COIN_REGISTRY = {
+    'bitcoin': {'tickers': ['BTC'], 'hashtags': ['#Bitcoin', '#BTC'], 'aliases': ['Bitcoin']},
+    'cardano': {'tickers': ['ADA'], 'hashtags': ['#Cardano', '#ADA'], 'aliases': ['Cardano']},
+}
+
+
+def coin_terms(registry=COIN_REGISTRY):
+    term_coins = {}
+    for coin, names in registry.items():
+        terms = (['$' + ticker for ticker in names.get('tickers', [])] + list(names.get('hashtags', []))
+                 + list(names.get('aliases', [])))
+        for term in terms:
+            term = term.lower()
+            if not term.strip('$#'):
+                raise ValueError('Empty term for %s in the coin registry' % (coin))
+            if term_coins.get(term, coin) != coin:
+                raise ValueError('%r is a term of both %s and %s' % (term, term_coins[term], coin))
+            term_coins[term] = coin
+    return term_coins
+
+
+def search_coin(search_term, registry=COIN_REGISTRY):
+    term_coins = coin_terms(registry)
+    if search_term.lower() not in term_coins:
+        raise ValueError('%r is not a term of any coin in the coin registry' % (search_term))
+    return term_coins[search_term.lower()]
+
+def term_trie(terms):
+    trie = {}
+    for term in terms:
+        node = trie
+        for character in term:
+            node = node.setdefault(character, {})
+        node[''] = {}
+    return trie
+
+
+def trie_pattern(trie):
+    branches = [re.escape(character) + trie_pattern(node) for character, node in sorted(trie.items()) if character]
+    if not branches:
+        return ''
+    if len(branches) == 1 and '' not in trie:
+        return branches[0]
+    pattern = '(?:%s)' % '|'.join(branches)
+    if '' in trie:
+        return pattern + '?'
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def tagging_pattern(terms):
+    return re.compile(r'%s|(?<!\w)(%s)(?!\w)' % (re.escape(TWEET_SEPARATOR), trie_pattern(term_trie(terms))))
+
+@instrumented
+def tag_tweets(original_tweets, registry=COIN_REGISTRY):
+    term_coins = coin_terms(registry)
+    coins = list(registry)
+    tweets = list(original_tweets)
+    joined = TWEET_SEPARATOR.join(tweets)
+    if joined.count(TWEET_SEPARATOR) != max(len(tweets) - 1, 0):
+        joined = TWEET_SEPARATOR.join(tweet.replace(TWEET_SEPARATOR, ' ') for tweet in tweets)
+    found = tagging_pattern(tuple(sorted(term_coins))).findall(joined.lower())
+    coin_codes = {coin: code for code, coin in enumerate(coins)}
+    term_codes = {term: coin_codes[coin] for term, coin in term_coins.items()}
+    term_codes[''] = -1
+    codes = np.array([term_codes[term] for term in found], dtype='int64')
+    positions = np.cumsum(codes < 0)[codes >= 0]
+    tags = np.unique(positions * len(coins) + codes[codes >= 0])
+    return pd.DataFrame({'tweet': tags // max(len(coins), 1),
+                         'coin': pd.Categorical.from_codes(tags % max(len(coins), 1), coins)})
+
+def coin_partial_sums(tweets, registry=COIN_REGISTRY, workers=1, chunk_size=DEFAULT_CHUNK_SIZE, cache=None,
+                      frequency='daily'):
+    tags = tag_tweets(tweets['tweet'], registry)
+    if len(tags.index) == 0:
+        return {}
+    mentioned = np.unique(tags['tweet'].to_numpy())
+    processed = clean_and_score_tweets(tweets['tweet'].iloc[mentioned], workers, chunk_size, cache)
+    processed = processed.reset_index(drop=True)
+    for column in ['date', 'time']:
+        if column in tweets.columns:
+            processed[column] = tweets[column].to_numpy()[mentioned]
+    mentions = processed.iloc[np.searchsorted(mentioned, tags['tweet'].to_numpy())]
+    return {coin: sentiment_partial_sums(coin_mentions, frequency)
+            for coin, coin_mentions in mentions.groupby(tags['coin'].to_numpy(), observed=True)}
+
+
+def coin_sentiment_frames_from_sums(coin_sums, registry=COIN_REGISTRY):
+    return {coin: sentiment_frame_from_sums(combine_partial_sums([coin_sums.get(coin)])) for coin in registry}
+
+
+@instrumented
+def coin_sentiment_frames(tweets, registry=COIN_REGISTRY, workers=1, chunk_size=DEFAULT_CHUNK_SIZE, cache=None,
+                          language='en', frequency='daily'):
+    tweets = tweets[tweets['language'] == language]
+    return coin_sentiment_frames_from_sums(
+        coin_partial_sums(tweets, registry, workers, chunk_size, cache, frequency), registry)
+
+
+@instrumented
+def stream_coin_sentiment_frames(raw_csv_path, registry=COIN_REGISTRY, read_rows=DEFAULT_READ_ROWS, workers=1,
+                                 chunk_size=DEFAULT_CHUNK_SIZE, cache=None, language='en', frequency='daily'):
+    columns = RAW_COLUMNS + ['time'] if intraday(frequency) else RAW_COLUMNS
+    totals = {}
+    for chunk in raw_tweet_chunks(raw_csv_path, read_rows, language, columns):
+        for coin, sums in coin_partial_sums(chunk, registry, workers, chunk_size, cache, frequency).items():
+            totals[coin] = combine_partial_sums([totals.get(coin), sums])
+    return coin_sentiment_frames_from_sums(totals, registry)
@@ -0,0 +1,83 @@
+import os
+import pandas as pd
+from instrumentation import instrumented
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+STORAGE_FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'arrow': '.arrow'}
+PARQUET_COMPRESSION = 'zstd'
+
+
+def storage_path(csv_path, storage):
+    if storage not in STORAGE_FORMATS:
+        raise ValueError('Unknown storage format %s, choose from %s' % (storage, ', '.join(STORAGE_FORMATS)))
+    return os.path.splitext(csv_path)[0] + STORAGE_FORMATS[storage]
+
+
+def require_pyarrow(storage):
+    if storage != 'csv' and pa is None:
+        raise ImportError("The '%s' storage format needs pyarrow (pip install pyarrow), or use 'csv'" % storage)
+
+def typed_frame(chosen_dataframe):
+    if chosen_dataframe.index.name is not None:
+        chosen_dataframe = chosen_dataframe.reset_index()
+    else:
+        chosen_dataframe = chosen_dataframe.reset_index(drop=True)
+    if 'date' in chosen_dataframe.columns:
+        chosen_dataframe['date'] = pd.to_datetime(chosen_dataframe['date'])
+    if 'Sentiment' in chosen_dataframe.columns:
+        chosen_dataframe['Sentiment'] = chosen_dataframe['Sentiment'].astype('category')
+    return chosen_dataframe
+
+
+@instrumented
+def write_frame(chosen_dataframe, csv_path, storage='csv', index=False):
+    require_pyarrow(storage)
+    path = storage_path(csv_path, storage)
+    if storage == 'csv':
+        chosen_dataframe.to_csv(path, index=index)
+        return path
+    table = pa.Table.from_pandas(typed_frame(chosen_dataframe), preserve_index=False)
+    if storage == 'parquet':
+        pq.write_table(table, path, compression=PARQUET_COMPRESSION)
+    else:
+        feather.write_feather(table, path, compression='uncompressed')
+    return path
+
+def read_table(csv_path, columns=None):
+    require_pyarrow('arrow')
+    return feather.read_table(storage_path(csv_path, 'arrow'), columns=columns, memory_map=True)
+
+
+@instrumented
+def read_frame(csv_path, columns=None, storage='csv', **csv_options):
+    require_pyarrow(storage)
+    path = storage_path(csv_path, storage)
+    if storage == 'csv':
+        return pd.read_csv(path, usecols=columns, **csv_options)
+    if storage == 'parquet':
+        return pq.read_table(path, columns=columns, memory_map=True).to_pandas()
+    return read_table(csv_path, columns).to_pandas(split_blocks=True)
+
+
+def frame_chunks(csv_path, columns=None, storage='csv', read_rows=100000, **csv_options):
+    require_pyarrow(storage)
+    path = storage_path(csv_path, storage)
+    if storage == 'csv':
+        yield from pd.read_csv(path, usecols=columns, chunksize=read_rows, **csv_options)
+        return
+    if storage == 'parquet':
+        batches = pq.ParquetFile(path, memory_map=True).iter_batches(read_rows, columns=columns)
+    else:
+        batches = read_table(csv_path, columns).to_batches(read_rows)
+    empty = True
+    for batch in batches:
+        empty = False
+        yield batch.to_pandas()
+    if empty:
+        yield read_frame(csv_path, columns, storage)
@@ -0,0 +1,28 @@
+import pandas as pd
+from columnar_storage import frame_chunks
+from sentiment_aggregation import SENTIMENT_CLASSES, text_counted
+
+SENTIMENT_DTYPE = pd.CategoricalDtype(SENTIMENT_CLASSES)
+COMPACT_DTYPES = {'Subjectivity': 'float32', 'Polarity': 'float32', 'Sentiment': SENTIMENT_DTYPE}
+CLEANED_COLUMNS = ['date', 'time', 'Clean_Tweet', 'Subjectivity', 'Polarity', 'Sentiment']
+
+def compact_frame(scored_tweets, keep_text=True):
+    compact = scored_tweets.astype({column: dtype for column, dtype in COMPACT_DTYPES.items()
+                                    if column in scored_tweets.columns})
+    if 'date' in compact.columns:
+        compact['date'] = pd.to_datetime(compact['date'])
+    if 'time' in compact.columns:
+        compact['time'] = pd.to_timedelta(compact['time'])
+    if not keep_text and 'Clean_Tweet' in compact.columns:
+        compact.insert(compact.columns.get_loc('Clean_Tweet'), 'Has_Text',
+                       text_counted(compact['Clean_Tweet']))
+        compact = compact.drop(columns='Clean_Tweet')
+    return compact
+
+READ_ROWS = 100000
+
+
+def read_compact_frame(csv_path, storage='csv', keep_text=False, read_rows=READ_ROWS):
+    chunks = frame_chunks(csv_path, CLEANED_COLUMNS, storage, read_rows, lineterminator='\n',
+                          dtype=COMPACT_DTYPES)
+    return pd.concat([compact_frame(chunk, keep_text) for chunk in chunks], ignore_index=True)
@@ -0,0 +1,124 @@
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+
+CORRELATION_METRICS = ['average_polarity', 'average_subjectivity', 'positive_percentage',
+                       'negative_percentage', 'objective', 'tweets']
+
+
+def dated_column(chosen_dataframe, date_column, column, dates):
+    values = pd.to_numeric(chosen_dataframe[column], errors='coerce').to_numpy(dtype=float)
+    series = pd.Series(values, index=pd.to_datetime(chosen_dataframe[date_column]))
+    return series.groupby(level=0).last().reindex(dates).to_numpy()
+
+
+def correlation_frame(sentiment_df, price_data, tweet_volume=None, google_trend=None):
+    dates = pd.DatetimeIndex(pd.to_datetime(price_data['Date']).drop_duplicates(), name='date')
+    frame = pd.DataFrame({'Close': dated_column(price_data, 'Date', 'Close', dates)}, index=dates)
+    if 'date' not in sentiment_df.columns:
+        sentiment_df = sentiment_df.reset_index()
+    for column in CORRELATION_METRICS:
+        if column in sentiment_df.columns:
+            frame[column] = dated_column(sentiment_df, 'date', column, dates)
+    if tweet_volume is not None:
+        frame['Tweets'] = dated_column(tweet_volume, 'Date', 'Tweets', dates)
+    if google_trend is not None:
+        frame['Search_Volume'] = dated_column(google_trend, 'Date', 'Search_Volume', dates)
+    return frame
+
+DEFAULT_LAGS = range(-30, 31)
+MIN_PERIODS = 3
+
+
+def centred_values(frame):
+    values = frame.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    means = np.where(valid, values, 0).sum(axis=0) / np.maximum(counts, 1)
+    return np.where(valid, values - means, 0), valid
+
+
+def correlations_from_sums(count, sum_x, sum_y, sum_xx, sum_yy, sum_xy, min_periods):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        covariance = sum_xy - sum_x * sum_y / count
+        variance_x = sum_xx - sum_x ** 2 / count
+        variance_y = sum_yy - sum_y ** 2 / count
+        correlation = covariance / np.sqrt(variance_x * variance_y)
+    correlation[(count < min_periods) | (variance_x <= 0) | (variance_y <= 0)] = np.nan
+    return np.clip(correlation, -1, 1)
+
+
+def lagged_correlations(frame, lags=DEFAULT_LAGS, min_periods=MIN_PERIODS):
+    values, valid = centred_values(frame)
+    values, valid = values.T, valid.T.astype(float)
+    lags = np.asarray(list(lags))
+    total = values.shape[1]
+    positions = np.arange(total)[None, :] - lags[:, None]
+    inside = (positions >= 0) & (positions < total)
+    positions = np.clip(positions, 0, total - 1)
+    moved = values[:, positions] * inside
+    moved_valid = valid[:, positions] * inside
+    sums = [np.einsum('ilt,jt->lij', left, right, optimize=True)
+            for left, right in [(moved_valid, valid), (moved, valid), (moved_valid, values),
+                                (moved ** 2, valid), (moved_valid, values ** 2), (moved, values)]]
+    return correlations_from_sums(*sums, min_periods)
+
+
+def correlation_matrix(results, lag=0):
+    position = list(results['lags']).index(lag)
+    return pd.DataFrame(results['matrices'][position], index=results['columns'], columns=results['columns'])
+
+
+def lag_table(results, target='Close'):
+    position = results['columns'].index(target)
+    table = pd.DataFrame(results['matrices'][:, :, position], index=pd.Index(results['lags'], name='lag'),
+                         columns=results['columns'])
+    return table.drop(columns=target)
+
+DEFAULT_WINDOW = 30
+
+
+def window_sums(values, window):
+    cumulative = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    ends = np.arange(1, len(values) + 1)
+    return cumulative[ends] - cumulative[np.maximum(ends - window, 0)]
+
+
+def rolling_correlations(frame, target='Close', window=DEFAULT_WINDOW, min_periods=MIN_PERIODS):
+    columns = [column for column in frame.columns if column != target]
+    values, valid = centred_values(frame[columns])
+    target_values, target_valid = centred_values(frame[[target]])
+    correlation = np.full(values.shape, np.nan)
+    for position in range(len(columns)):
+        rows = np.flatnonzero(valid[:, position] & target_valid[:, 0])
+        x = values[rows, position]
+        y = target_values[rows, 0]
+        sums = window_sums(np.column_stack([np.ones(len(rows)), x, y, x ** 2, y ** 2, x * y]), window)
+        correlation[rows, position] = correlations_from_sums(*sums.T, min_periods)
+    return pd.DataFrame(correlation, index=frame.index, columns=columns)
+
+CORRELATION_CACHE_DIRECTORY = '../../output_data/correlation_data/cache'
+CORRELATION_VERSION = 2
+
+
+def correlation_key(frame, lags, target, window):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    digest.update(repr((list(frame.columns), list(lags), target, window, MIN_PERIODS, CORRELATION_VERSION)).encode())
+    return digest.hexdigest()
+
+
+def cached_correlations(frame, lags=DEFAULT_LAGS, target='Close', window=DEFAULT_WINDOW,
+                        directory=CORRELATION_CACHE_DIRECTORY):
+    path = os.path.join(directory, '%s.pickle' % (correlation_key(frame, lags, target, window)))
+    if os.path.exists(path):
+        return pd.read_pickle(path)
+    results = {'lags': np.asarray(list(lags)),
+               'columns': list(frame.columns),
+               'matrices': lagged_correlations(frame, lags),
+               'rolling': rolling_correlations(frame, target, window)}
+    os.makedirs(directory, exist_ok=True)
+    pd.to_pickle(results, path + '.part')
+    os.replace(path + '.part', path)
+    return results
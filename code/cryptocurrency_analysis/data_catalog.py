@@ -0,0 +1,59 @@
+import os
+import pandas as pd
+from columnar_storage import read_frame, storage_path
+from compact_frames import COMPACT_DTYPES
+
+DATASETS = {
+    'prices': {'dtypes': {'Close': 'float64'}, 'dates': ['Date'], 'times': [], 'stored': False},
+    'tweet_volume': {'dtypes': {'Tweets': 'float64'}, 'dates': ['Date'], 'times': [], 'stored': False},
+    'google_trend': {'dtypes': {}, 'dates': ['Date'], 'times': [], 'stored': False},
+    'correlation': {'dtypes': {}, 'dates': ['date'], 'times': [], 'stored': False},
+    'cleaned_tweets': {'dtypes': COMPACT_DTYPES,
+                       'dates': ['date'], 'times': ['time'], 'stored': True},
+    'sentiment': {'dtypes': {'tweets': 'int64', 'positive_sentiment': 'int64', 'negative_sentiment': 'int64',
+                             'neutral_sentiment': 'int64', 'average_polarity': 'float64',
+                             'average_subjectivity': 'float64', 'positive_percentage': 'float64',
+                             'negative_percentage': 'float64', 'objective': 'float64', 'neutral': 'float64'},
+                  'dates': ['date'], 'times': [], 'stored': True},
+}
+
+class DataCatalog:
+    def __init__(self, storage='csv'):
+        self.storage = storage
+        self.frames = {}
+        self.stats = {'loads': 0, 'hits': 0, 'file_bytes': 0, 'frame_bytes': 0}
+
+    def load(self, csv_path, dataset, columns=None):
+        schema = DATASETS[dataset]
+        if schema['stored']:
+            storage = self.storage
+        else:
+            storage = 'csv'
+        path = storage_path(csv_path, storage)
+        key = (path, None if columns is None else tuple(columns))
+        modified = os.stat(path).st_mtime_ns
+        if key in self.frames and self.frames[key][0] == modified:
+            self.stats['hits'] += 1
+            return self.frames[key][1]
+        if storage != 'csv':
+            frame = read_frame(csv_path, columns, storage)
+        elif schema['stored']:
+            frame = read_frame(csv_path, columns, storage, lineterminator='\n', dtype=schema['dtypes'])
+        else:
+            frame = read_frame(csv_path, columns, storage, dtype=schema['dtypes'])
+        frame = frame.astype({column: dtype for column, dtype in schema['dtypes'].items()
+                              if column in frame.columns})
+        for column in schema['dates']:
+            if column in frame.columns:
+                frame[column] = pd.to_datetime(frame[column])
+        for column in schema['times']:
+            if column in frame.columns:
+                frame[column] = pd.to_timedelta(frame[column])
+        self.frames[key] = (modified, frame)
+        self.stats['loads'] += 1
+        self.stats['file_bytes'] += os.path.getsize(path)
+        self.stats['frame_bytes'] += int(frame.memory_usage(deep=True).sum())
+        return frame
+
+    def report(self):
+        return dict(self.stats)
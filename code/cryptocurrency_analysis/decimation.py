@@ -0,0 +1,74 @@
+import numpy as np
+
+MIN_BAR_PIXELS = 16
+
+
+def line_points(ax):
+    return max(3, int(ax.bbox.width))
+
+
+def bar_count(ax):
+    return max(1, int(ax.bbox.height / MIN_BAR_PIXELS))
+
+def numeric_positions(x):
+    x = np.asarray(x)
+    if x.dtype.kind == 'M':
+        return x.astype('datetime64[ns]').astype('int64').astype(float)
+    if x.dtype.kind in 'iufb':
+        return x.astype(float)
+    return np.arange(len(x), dtype=float)
+
+
+def lttb_indices(x, y, points):
+    total = len(y)
+    if points >= total or points < 3:
+        return np.arange(total)
+    edges = np.linspace(1, total - 1, points - 1).astype(int)
+    selected = np.empty(points, dtype=int)
+    selected[0] = 0
+    selected[-1] = total - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket == points - 3:
+            next_x, next_y = x[total - 1], y[total - 1]
+        else:
+            next_end = edges[bucket + 2]
+            next_x = x[end:next_end].mean()
+            next_values = y[end:next_end]
+            next_values = next_values[~np.isnan(next_values)]
+            next_y = next_values.mean() if len(next_values) > 0 else y[previous]
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (next_y - y[previous]))
+        areas[np.isnan(areas)] = -1
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def line_indices(x, y, points):
+    y = np.asarray(y, dtype=float)
+    keep = lttb_indices(numeric_positions(x), y, points)
+    if len(keep) < len(y) and not np.isnan(y).all():
+        keep = np.union1d(keep, [np.nanargmin(y), np.nanargmax(y)])
+    return keep
+
+
+def decimated(x, y, points):
+    keep = line_indices(x, y, points)
+    return np.asarray(x)[keep], np.asarray(y)[keep]
+
+def bucket_bars(chosen_dataframe, columns, bars, label='date', weights=None):
+    total = len(chosen_dataframe.index)
+    if total <= bars:
+        return chosen_dataframe
+    buckets = np.arange(total) * bars // total
+    values = chosen_dataframe[columns].reset_index(drop=True)
+    if weights is None:
+        bucketed = values.groupby(buckets).mean()
+    else:
+        weight = chosen_dataframe[weights].reset_index(drop=True)
+        bucketed = (values.mul(weight, axis=0).groupby(buckets).sum()
+                    .div(weight.groupby(buckets).sum(), axis=0))
+    bucketed.insert(0, label, chosen_dataframe[label].reset_index(drop=True).groupby(buckets).first())
+    return bucketed.reset_index(drop=True)
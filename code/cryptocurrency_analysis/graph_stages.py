@@ -0,0 +1,32 @@
+import os
+import runpy
+import pandas as pd
+from columnar_storage import read_frame
+from project_paths import sentiment_dataframe_path, input_data_path, correlation_data_path
+from correlation_engine import correlation_frame, cached_correlations
+from instrumentation import instrumented
+
+PLOT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sentiment_plots_final.py')
+
+
+def check_correlation_frequency(frequency):
+    if frequency != 'daily':
+        raise ValueError('only daily sentiment can be correlated with the daily price data, not %s' % (frequency))
+
+
+@instrumented
+def correlate_stage(coin, duration, frequency, storage):
+    check_correlation_frequency(frequency)
+    sentiment_df = read_frame(sentiment_dataframe_path(coin, duration, frequency), storage=storage)
+    correlation_df = correlation_frame(sentiment_df, pd.read_csv(input_data_path(coin, 'cp', duration)),
+                                       pd.read_csv(input_data_path(coin, 'tv', duration)),
+                                       pd.read_csv(input_data_path(coin, 'gt', duration)))
+    correlation_df.to_csv(correlation_data_path(coin, duration))
+    cached_correlations(pd.read_csv(correlation_data_path(coin, duration), index_col='date', parse_dates=['date']))
+
+
+@instrumented
+def plot_stage(plot_script, storage, frequency='daily'):
+    os.environ['SENTIMENT_STORAGE'] = storage
+    os.environ['SENTIMENT_FREQUENCY'] = frequency
+    runpy.run_path(plot_script, run_name='__main__')
@@ -0,0 +1,192 @@
+import os
+import sys
+import json
+import time
+import cProfile
+import pstats
+import threading
+import functools
+import numpy as np
+import pandas as pd
+
+METRICS_ENVIRONMENT = 'SENTIMENT_METRICS'
+PROFILE_ENVIRONMENT = 'SENTIMENT_PROFILE'
+DEFAULT_METRICS_PATH = '../../output_data/metrics/metrics.jsonl'
+
+
+def enable_instrumentation(metrics_path=DEFAULT_METRICS_PATH, profile=()):
+    os.environ[METRICS_ENVIRONMENT] = os.path.abspath(metrics_path)
+    os.environ[PROFILE_ENVIRONMENT] = ','.join(profile)
+
+
+def disable_instrumentation():
+    os.environ.pop(METRICS_ENVIRONMENT, None)
+    os.environ.pop(PROFILE_ENVIRONMENT, None)
+
+SAMPLE_SECONDS = 0.005
+
+
+def resident_memory():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class MemorySampler:
+    def __init__(self, interval=SAMPLE_SECONDS):
+        self.interval = interval
+        self.peak = resident_memory()
+        self.finished = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def sample(self):
+        while not self.finished.wait(self.interval):
+            self.peak = max(self.peak, resident_memory())
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.finished.set()
+        self.thread.join()
+        self.peak = max(self.peak, resident_memory())
+
+
+def io_bytes():
+    try:
+        with open('/proc/self/io') as io_file:
+            counters = dict(line.split(': ') for line in io_file.read().splitlines())
+        return int(counters['rchar']), int(counters['wchar'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def rows(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index, np.ndarray, list)) and np.ndim(value) > 0:
+        return len(value)
+    return None
+
+
+def rows_in(arguments):
+    for argument in arguments:
+        if rows(argument) is not None:
+            return rows(argument)
+    return None
+
+STEPS = threading.local()
+
+
+def write_metrics(metrics_path, record):
+    if os.path.dirname(metrics_path):
+        os.makedirs(os.path.dirname(metrics_path), exist_ok=True)
+    with open(metrics_path, 'a') as metrics_file:
+        metrics_file.write(json.dumps(record) + '\n')
+
+
+def instrumented(function):
+    @functools.wraps(function)
+    def instrumented_function(*arguments, **keywords):
+        metrics_path = os.environ.get(METRICS_ENVIRONMENT)
+        if not metrics_path:
+            return function(*arguments, **keywords)
+        return measured_call(metrics_path, function, arguments, keywords)
+    return instrumented_function
+
+
+def measured_call(metrics_path, function, arguments, keywords):
+    stack = STEPS.__dict__.setdefault('stack', [])
+    record = {'stage': function.__name__,
+              'parent': stack[-1] if stack else None,
+              'pid': os.getpid(),
+              'started': pd.Timestamp.now(tz='UTC').isoformat(),
+              'rows_in': rows_in(arguments),
+              'rows_out': None,
+              'error': None}
+    profiler = stage_profiler(function.__name__)
+    start_bytes = io_bytes()
+    stack.append(function.__name__)
+    try:
+        with MemorySampler() as sampler:
+            start_wall, start_cpu = time.perf_counter(), time.process_time()
+            try:
+                if profiler is None:
+                    result = function(*arguments, **keywords)
+                else:
+                    result = profiler.runcall(function, *arguments, **keywords)
+            finally:
+                record['wall_seconds'] = round(time.perf_counter() - start_wall, 6)
+                record['cpu_seconds'] = round(time.process_time() - start_cpu, 6)
+        record['rows_out'] = rows(result)
+        return result
+    except BaseException as error:
+        record['error'] = repr(error)
+        raise
+    finally:
+        stack.pop()
+        end_bytes = io_bytes()
+        record['peak_rss_mb'] = round(sampler.peak / 2**20, 1)
+        record['bytes_read'] = None if start_bytes is None else end_bytes[0] - start_bytes[0]
+        record['bytes_written'] = None if start_bytes is None else end_bytes[1] - start_bytes[1]
+        if profiler is not None:
+            record.update(profile_report(profiler, function.__name__, metrics_path))
+            STEPS.profiling = False
+        write_metrics(metrics_path, record)
+
+HOT_SPOTS = 15
+
+
+def stage_profiler(name):
+    if name not in os.environ.get(PROFILE_ENVIRONMENT, '').split(','):
+        return None
+    if getattr(STEPS, 'profiling', False):
+        return None
+    STEPS.profiling = True
+    return cProfile.Profile()
+
+
+def profile_directory(metrics_path):
+    return os.path.join(os.path.dirname(metrics_path), 'profiles')
+
+
+def profile_report(profiler, name, metrics_path):
+    os.makedirs(profile_directory(metrics_path), exist_ok=True)
+    profile_path = os.path.join(profile_directory(metrics_path),
+                                '%s_%d_%d.prof' % (name, os.getpid(), time.time_ns()))
+    profiler.dump_stats(profile_path)
+    functions = pstats.Stats(profiler).stats
+    hot_spots = sorted(functions.items(), key=lambda item: item[1][2], reverse=True)[:HOT_SPOTS]
+    return {'profile': profile_path,
+            'hot_spots': [{'function': '%s:%d(%s)' % location,
+                           'calls': calls,
+                           'own_seconds': round(own_seconds, 6),
+                           'total_seconds': round(total_seconds, 6)}
+                          for location, (primitive_calls, calls, own_seconds, total_seconds, callers)
+                          in hot_spots]}
+
+def read_metrics(metrics_path=DEFAULT_METRICS_PATH):
+    return pd.read_json(metrics_path, lines=True)
+
+
+def metrics_summary(metrics_path=DEFAULT_METRICS_PATH):
+    metrics = read_metrics(metrics_path)
+    summary = metrics.groupby('stage').agg(calls=('stage', 'size'), wall_seconds=('wall_seconds', 'sum'),
+                                           cpu_seconds=('cpu_seconds', 'sum'), rows_in=('rows_in', 'sum'),
+                                           bytes_read=('bytes_read', 'sum'),
+                                           bytes_written=('bytes_written', 'sum'),
+                                           peak_rss_mb=('peak_rss_mb', 'max'))
+    return summary.sort_values('wall_seconds', ascending=False)
+
+
+def combined_profile(stage, metrics_path=DEFAULT_METRICS_PATH):
+    metrics = read_metrics(metrics_path)
+    if 'profile' not in metrics.columns:
+        raise ValueError('No step has been profiled in %s' % (metrics_path))
+    profile_paths = metrics.loc[metrics['stage'] == stage, 'profile'].dropna().tolist()
+    if not profile_paths:
+        raise ValueError('%s has not been profiled in %s' % (stage, metrics_path))
+    return pstats.Stats(*profile_paths)
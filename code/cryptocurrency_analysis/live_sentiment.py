@@ -0,0 +1,220 @@
+import os
+import json
+import time
+import socket
+from collections import deque
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from tweet_cleaning import clean_tweet_text, COIN_TAGS
+from sentiment_scoring import score_tweet, sentiment_label, lexicon_index
+from sentiment_aggregation import SUM_COLUMNS, CSV_NA_VALUES, FREQUENCIES, sentiment_frame_from_sums
+
+DEFAULT_LIVE_TWEETS = '../../output_data/live_tweets/tweets.jsonl'
+POLL_SECONDS = 0.002
+DEFAULT_PORT = 8765
+
+
+def tail_lines(jsonl_path, from_start=False, poll_seconds=POLL_SECONDS, idle_seconds=None):
+    with open(jsonl_path, 'rb') as jsonl_file:
+        if not from_start:
+            jsonl_file.seek(0, os.SEEK_END)
+        partial = b''
+        last_line = time.monotonic()
+        while True:
+            line = jsonl_file.readline()
+            if not line:
+                if os.path.getsize(jsonl_path) < jsonl_file.tell():
+                    jsonl_file.seek(0)
+                    partial = b''
+                elif idle_seconds is not None and time.monotonic() - last_line > idle_seconds:
+                    return
+                time.sleep(poll_seconds)
+                continue
+            if not line.endswith(b'\n'):
+                partial += line
+                continue
+            line, partial = partial + line, b''
+            last_line = time.monotonic()
+            if line.strip():
+                yield line
+
+
+def socket_lines(host='127.0.0.1', port=DEFAULT_PORT, connections=None):
+    with socket.create_server((host, port)) as server:
+        served = 0
+        while connections is None or served < connections:
+            connection, address = server.accept()
+            with connection, connection.makefile('rb') as lines:
+                for line in lines:
+                    if line.strip():
+                        yield line
+            served += 1
+
+DEFAULT_HISTORY = 1440
+SENTIMENT_SUMS = {'Positive': 1, 'Negative': 2, 'Neutral': 3}
+NA_TEXT = frozenset(CSV_NA_VALUES)
+EPOCH = datetime(1970, 1, 1)
+
+
+def window_seconds(frequency):
+    try:
+        return to_offset(FREQUENCIES.get(frequency, frequency)).nanos / 10**9
+    except ValueError:
+        raise ValueError("Live windows must have a fixed length, not '%s'" % frequency)
+
+
+def empty_sums():
+    return [0, 0, 0, 0, 0, 0.0, 0.0]
+
+
+def window_values(start, sums):
+    tweets, positive, negative, neutral, scored, polarity, subjectivity = sums
+    values = {'date': pd.Timestamp(start, unit='s'),
+              'tweets': tweets,
+              'positive_sentiment': positive,
+              'negative_sentiment': negative,
+              'neutral_sentiment': neutral,
+              'average_polarity': polarity / scored if scored else float('nan'),
+              'average_subjectivity': subjectivity / scored if scored else float('nan'),
+              'positive_percentage': positive / tweets if tweets else float('nan'),
+              'negative_percentage': negative / tweets if tweets else float('nan'),
+              'objective': (positive + negative) / tweets if tweets else float('nan')}
+    values['neutral'] = 1 - values['objective']
+    return values
+
+
+class SentimentWindow:
+    def __init__(self, length, step=None, history=DEFAULT_HISTORY):
+        self.length = window_seconds(length)
+        self.step = self.length if step is None else window_seconds(step)
+        if self.length % self.step:
+            raise ValueError('The window length must be a whole number of steps')
+        self.buckets = deque()
+        self.totals = empty_sums()
+        self.history = deque(maxlen=history)
+        self.late = 0
+
+    def add(self, seconds, polarity, subjectivity, counted):
+        start = seconds - seconds % self.step
+        if not self.buckets:
+            self.buckets.append([start, empty_sums()])
+        elif start > self.buckets[-1][0]:
+            self.advance(start)
+        position = len(self.buckets) - 1 - int((self.buckets[-1][0] - start) // self.step)
+        if position < 0:
+            self.late += 1
+            return
+        label = SENTIMENT_SUMS[sentiment_label(polarity)]
+        for sums in (self.buckets[position][1], self.totals):
+            sums[0] += counted
+            sums[label] += 1
+            sums[4] += 1
+            sums[5] += polarity
+            sums[6] += subjectivity
+
+    def advance(self, start):
+        while self.buckets[-1][0] < start:
+            if self.totals[4]:
+                self.history.append((self.window_start(), tuple(self.totals)))
+            next_start = self.buckets[-1][0] + self.step
+            if not self.totals[4] and start - next_start >= self.length:
+                next_start = start
+            self.buckets.append([next_start, empty_sums()])
+            while self.buckets[0][0] <= next_start - self.length:
+                expired = self.buckets.popleft()[1]
+                for column, value in enumerate(expired):
+                    self.totals[column] -= value
+            if not self.totals[4]:
+                self.totals = empty_sums()
+
+    def window_start(self):
+        return self.buckets[-1][0] + self.step - self.length
+
+    def current(self):
+        if not self.buckets:
+            return None
+        return window_values(self.window_start(), self.totals)
+
+    def frame(self):
+        windows = list(self.history)
+        if self.buckets and self.totals[4]:
+            windows.append((self.window_start(), tuple(self.totals)))
+        sums = pd.DataFrame([sums for start, sums in windows], columns=SUM_COLUMNS,
+                            index=pd.to_datetime([start for start, sums in windows], unit='s'))
+        return sentiment_frame_from_sums(sums)
+
+LATENCY_SAMPLES = 10000
+
+
+class LiveSentiment:
+    def __init__(self, windows, language='en', coin_tags=COIN_TAGS, latency_samples=LATENCY_SAMPLES):
+        self.windows = windows
+        self.language = language
+        self.coin_tags = coin_tags
+        self.index = lexicon_index()
+        self.latencies = deque(maxlen=latency_samples)
+        self.tweets = 0
+        self.skipped = 0
+
+    def add_line(self, line):
+        received = time.perf_counter()
+        record = json.loads(line)
+        if self.language is not None and record.get('language', self.language) != self.language:
+            self.skipped += 1
+            return
+        clean_tweet = clean_tweet_text(record['tweet'], self.coin_tags)
+        polarity, subjectivity = score_tweet(clean_tweet, self.index)
+        if 'date' in record:
+            stamp = datetime.fromisoformat('%s %s' % (record['date'], record.get('time', '00:00:00')))
+            seconds = (stamp - EPOCH).total_seconds()
+        else:
+            seconds = time.time()
+        counted = clean_tweet not in NA_TEXT
+        for window in self.windows.values():
+            window.add(seconds, polarity, subjectivity, counted)
+        self.tweets += 1
+        self.latencies.append(time.perf_counter() - received)
+
+    def run(self, lines, on_update=None):
+        for line in lines:
+            self.add_line(line)
+            if on_update is not None:
+                on_update(self)
+
+    def current(self):
+        return {name: window.current() for name, window in self.windows.items()}
+
+    def latency_summary(self):
+        if not self.latencies:
+            return None
+        median, slowest_share = np.percentile(np.array(self.latencies) * 1000, [50, 99])
+        return {'tweets': self.tweets,
+                'median_ms': round(float(median), 3),
+                'p99_ms': round(float(slowest_share), 3),
+                'max_ms': round(max(self.latencies) * 1000, 3)}
+
+if __name__ == "__main__":
+    LIVE_TWEETS = DEFAULT_LIVE_TWEETS
+    PORT = None
+    PRINT_SECONDS = 10
+
+    live = LiveSentiment({'minute': SentimentWindow('1min'),
+                          'last_hour': SentimentWindow('h', '1min'),
+                          'daily': SentimentWindow('daily')})
+    if PORT:
+        lines = socket_lines(port=PORT)
+    else:
+        os.makedirs(os.path.dirname(LIVE_TWEETS), exist_ok=True)
+        open(LIVE_TWEETS, 'a').close()
+        lines = tail_lines(LIVE_TWEETS)
+
+    printed = time.monotonic()
+    for line in lines:
+        live.add_line(line)
+        if time.monotonic() - printed > PRINT_SECONDS:
+            for name, values in live.current().items():
+                print("Live sentiment ", name, values)
+            print("Latency ", live.latency_summary())
+            printed = time.monotonic()
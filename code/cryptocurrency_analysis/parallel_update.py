@@ -0,0 +1,94 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from sentiment_scoring import lexicon_index, score_tweets, sentiment_labels
+from tweet_cleaning import clean_tweets
+from instrumentation import instrumented
+
+DEFAULT_CHUNK_SIZE = 20000
+
+
+def clean_chunk(tweets):
+    return clean_tweets(tweets).tolist()
+
+
+def score_chunk(clean):
+    scores = score_tweets(clean)
+    return scores['Subjectivity'].to_numpy(), scores['Polarity'].to_numpy()
+
+
+def clean_and_score(tweets):
+    clean = clean_chunk(tweets)
+    return (clean,) + score_chunk(clean)
+
+
+def tweet_chunks(tweets, chunk_size):
+    for start in range(0, len(tweets), chunk_size):
+        yield tweets[start:start + chunk_size]
+
+def pool_context():
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def map_chunks(function, items, executor, chunk_size):
+    if executor is None or len(items) <= chunk_size:
+        return [function(items)]
+    return list(executor.map(function, tweet_chunks(items, chunk_size)))
+
+
+def score_in_chunks(clean, executor, chunk_size):
+    results = map_chunks(score_chunk, clean, executor, chunk_size)
+    return pd.DataFrame({
+        'Subjectivity': np.concatenate([result[0] for result in results]),
+        'Polarity': np.concatenate([result[1] for result in results]),
+    })
+
+
+@instrumented
+def clean_and_score_tweets(original_tweets, workers=1, chunk_size=DEFAULT_CHUNK_SIZE, cache=None):
+    tweets = list(original_tweets)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('workers must be at least 1, not %r' % (workers,))
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1, not %r' % (chunk_size,))
+    total_chunks = max(1, -(-len(tweets) // chunk_size))
+    workers = min(workers, total_chunks)
+    if workers > 1:
+        lexicon_index()
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=pool_context())
+    else:
+        executor = None
+    try:
+        if cache is None:
+            results = map_chunks(clean_and_score, tweets, executor, chunk_size)
+            clean = [tweet for result in results for tweet in result[0]]
+            subjectivity = np.concatenate([result[1] for result in results])
+            polarity = np.concatenate([result[2] for result in results])
+        else:
+            results = map_chunks(clean_chunk, tweets, executor, chunk_size)
+            clean = [tweet for result in results for tweet in result]
+            scores = cache.score_tweets(clean, scorer=lambda unseen: score_in_chunks(
+                unseen, executor, chunk_size))
+            subjectivity = scores['Subjectivity'].to_numpy()
+            polarity = scores['Polarity'].to_numpy()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    if isinstance(original_tweets, pd.Series):
+        processed_index = original_tweets.index
+    else:
+        processed_index = None
+    processed = pd.DataFrame({
+        'Clean_Tweet': pd.Series(clean, dtype=object, index=processed_index),
+        'Subjectivity': subjectivity,
+        'Polarity': polarity,
+    }, index=processed_index)
+    processed['Sentiment'] = sentiment_labels(processed['Polarity'])
+    return processed
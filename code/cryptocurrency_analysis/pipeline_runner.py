@@ -0,0 +1,119 @@
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from parallel_update import pool_context
+
+class Stage:
+    def __init__(self, name, function, inputs=(), outputs=(), arguments=()):
+        self.name = name
+        self.function = function
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.arguments = tuple(arguments)
+
+    def settings(self):
+        return '%s.%s%r' % (self.function.__module__, self.function.__name__, self.arguments)
+
+    def run(self):
+        return self.function(*self.arguments)
+
+DEFAULT_STATE_PATH = '../../output_data/pipeline_state.json'
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def file_fingerprint(path, method='mtime'):
+    if not os.path.exists(path):
+        return None
+    if method == 'mtime':
+        status = os.stat(path)
+        return '%d:%d' % (status.st_size, status.st_mtime_ns)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as chosen_file:
+        for block in iter(lambda: chosen_file.read(HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_state(state_path):
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path) as state_file:
+        return json.load(state_file)
+
+
+def save_state(state, state_path):
+    if os.path.dirname(state_path):
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    with open(state_path + '.tmp', 'w') as state_file:
+        json.dump(state, state_file, indent=1, sort_keys=True)
+    os.replace(state_path + '.tmp', state_path)
+
+
+def stage_record(stage, method):
+    return {'settings': stage.settings(),
+            'inputs': {path: file_fingerprint(path, method) for path in stage.inputs},
+            'outputs': {path: file_fingerprint(path, method) for path in stage.outputs}}
+
+
+def stage_is_current(stage, state, method='mtime'):
+    if not all(os.path.exists(path) for path in stage.outputs):
+        return False
+    if not stage.inputs:
+        return True
+    return state.get(stage.name) == stage_record(stage, method)
+
+def stage_dependencies(stages):
+    producers = {}
+    for stage in stages:
+        for path in stage.outputs:
+            if path in producers:
+                raise ValueError('%s is written by both %s and %s' % (path, producers[path], stage.name))
+            producers[path] = stage.name
+    return {stage.name: {producers[path] for path in stage.inputs if path in producers} - {stage.name}
+            for stage in stages}
+
+
+def run_pipeline(stages, state_path=DEFAULT_STATE_PATH, workers=None, method='mtime', force=False):
+    stages = {stage.name: stage for stage in stages}
+    dependencies = stage_dependencies(stages.values())
+    state = load_state(state_path)
+    results = {}
+    running = {}
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+        while len(results) < len(stages):
+            progress = False
+            for name, stage in stages.items():
+                if name in results or name in running.values():
+                    continue
+                if not dependencies[name] <= set(results):
+                    continue
+                progress = True
+                if any(results[dependency] in ('failed', 'blocked') for dependency in dependencies[name]):
+                    results[name] = 'blocked'
+                elif (force is not True and name not in (force or ())
+                      and stage_is_current(stage, state, method)):
+                    results[name] = 'skipped'
+                elif len(running) < workers:
+                    running[executor.submit(stage.run)] = name
+            if not running:
+                if not progress:
+                    raise ValueError('The stages %s depend on each other'
+                                     % ', '.join(sorted(set(stages) - set(results))))
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                if future.exception() is None:
+                    results[name] = 'run'
+                    state[name] = stage_record(stages[name], method)
+                else:
+                    results[name] = 'failed'
+                    state.pop(name, None)
+                    print('Stage %s failed: %r' % (name, future.exception()))
+                save_state(state, state_path)
+    failed = [name for name, result in results.items() if result == 'failed']
+    if failed:
+        raise RuntimeError('Pipeline stages failed: %s' % ', '.join(failed))
+    return results
@@ -0,0 +1,41 @@
+import os
+import gc
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from parallel_update import pool_context
+
+def new_figure(figsize=None):
+    return Figure(figsize=figsize)
+
+
+def save_figure(figure, path):
+    figure.savefig(path, bbox_inches='tight')
+    figure.clear()
+    gc.collect()
+
+def chart_name(function, arguments):
+    return '%s(%s)' % (function.__name__, ', '.join(argument for argument in arguments
+                                                    if isinstance(argument, str)))
+
+
+def render_charts(charts, workers=None):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(charts))
+    if workers <= 1:
+        for function, arguments in charts:
+            function(*arguments)
+        return len(charts)
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+        futures = {executor.submit(function, *arguments): chart_name(function, arguments)
+                   for function, arguments in charts}
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                failed.append(futures[future])
+                print('Chart %s failed: %r' % (futures[future], future.exception()))
+    if failed:
+        raise RuntimeError('Charts failed: %s' % ', '.join(failed))
+    return len(charts)
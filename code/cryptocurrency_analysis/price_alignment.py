@@ -0,0 +1,39 @@
+import pandas as pd
+from sentiment_aggregation import period_starts
+
+PYRAMID_FREQUENCIES = ['daily', 'weekly', 'monthly']
+
+
+class PricePyramid:
+    def __init__(self, price_data):
+        closes = pd.Series(price_data['Close'].to_numpy(dtype=float),
+                           index=pd.to_datetime(price_data['Date']))
+        closes = closes.groupby(level=0).last()
+        self.levels = {'daily': pd.DataFrame({'Date': closes.index, 'Close': closes.to_numpy()})}
+        self.joins = {}
+        for frequency in PYRAMID_FREQUENCIES:
+            self.level(frequency)
+
+    def level(self, frequency):
+        if frequency not in self.levels:
+            daily = self.levels['daily']
+            closes = daily['Close'].groupby(period_starts(daily['Date'], frequency)).last()
+            self.levels[frequency] = pd.DataFrame({'Date': closes.index, 'Close': closes.to_numpy()})
+        return self.levels[frequency]
+
+    def aligned(self, dates, frequency='daily'):
+        dates = pd.Series(pd.to_datetime(pd.Series(dates)).to_numpy(), name='Date')
+        key = (frequency, dates.to_numpy().tobytes())
+        if key not in self.joins:
+            ordered = dates.dropna().sort_values(kind='stable').reset_index()
+            level = self.level(frequency)
+            merged = pd.merge_asof(ordered, level.astype({'Date': ordered['Date'].dtype}),
+                                   on='Date', direction='backward')
+            closes = pd.Series(merged['Close'].to_numpy(), index=merged['index']).reindex(range(len(dates)))
+            self.joins[key] = pd.DataFrame({'Date': dates, 'Close': closes.to_numpy()})
+        return self.joins[key]
+
+    def joined(self, chosen_dataframe, date_column, frequency='daily'):
+        joined_dataframe = chosen_dataframe.copy()
+        joined_dataframe['Close'] = self.aligned(chosen_dataframe[date_column], frequency)['Close'].to_numpy()
+        return joined_dataframe
@@ -0,0 +1,24 @@
+def cleaned_tweet_path(coin, duration):
+    return '../../output_data/clean_tweet_data/%s_cleaned_tweets_%s.csv' % (coin, duration)
+
+
+def sentiment_dataframe_path(cryptocoin, duration, frequency='daily'):
+    if frequency == 'daily':
+        suffix = ''
+    else:
+        suffix = '_%s' % (frequency)
+    if duration == 'snapshot':
+        return '../../output_data/sentiment_dataframes_csv/%s_sentiment_dataframe_snapshot%s.csv' % (cryptocoin, suffix)
+    else:
+        return '../../output_data/sentiment_dataframes_csv/%s_sentiment_dataframe_extended%s.csv' % (cryptocoin, suffix)
+
+
+def input_data_path(coin, name, duration):
+    return '../../input_data/%s_%s_%s.csv' % (coin, name, duration)
+
+
+def correlation_data_path(coin, duration):
+    if duration == "snapshot":
+        return '../../output_data/correlation_data/%s_correlation.csv' % (coin)
+    else:
+        return '../../output_data/correlation_data/%s_correlation_extended.csv' % (coin)
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+from instrumentation import instrumented
+
+SUM_COLUMNS = ['tweets', 'positive_sentiment', 'negative_sentiment', 'neutral_sentiment',
+               'scored_tweets', 'polarity_sum', 'subjectivity_sum']
+SENTIMENT_CLASSES = ['Positive', 'Negative', 'Neutral']
+CSV_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                 '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+                 'n/a', 'nan', 'null']
+
+
+def text_counted(clean_tweets):
+    return (clean_tweets.notna() & ~clean_tweets.isin(CSV_NA_VALUES)).to_numpy()
+
+FREQUENCIES = {'hourly': 'h', 'daily': 'D', 'weekly': 'W-SUN', 'monthly': 'M'}
+FIXED_OFFSETS = (pd.offsets.Tick, pd.offsets.Day)
+START_OFFSETS = (pd.offsets.MonthBegin, pd.offsets.QuarterBegin, pd.offsets.YearBegin)
+
+
+def frequency_offset(frequency):
+    frequency = FREQUENCIES.get(frequency, frequency)
+    try:
+        offset = pd.Period('2021-01-01', frequency).freq
+    except ValueError:
+        try:
+            offset = pd.tseries.frequencies.to_offset(frequency)
+        except ValueError:
+            offset = None
+        if not isinstance(offset, START_OFFSETS):
+            raise ValueError('%s is not a frequency the sentiment can be grouped by' % (frequency))
+    if offset.n != 1 and not isinstance(offset, FIXED_OFFSETS):
+        raise ValueError('%s is a multiple of a calendar period, which the sentiment cannot be grouped by'
+                         % (frequency))
+    return offset
+
+
+def intraday(frequency):
+    return isinstance(frequency_offset(frequency), pd.offsets.Tick)
+
+
+def period_starts(timestamps, frequency):
+    offset = frequency_offset(frequency)
+    timestamps = pd.DatetimeIndex(timestamps)
+    if isinstance(offset, FIXED_OFFSETS):
+        return timestamps.floor(offset)
+    if isinstance(offset, START_OFFSETS):
+        return timestamps.normalize() + offset - offset
+    return timestamps.to_period(offset).start_time
+
+def tweet_timestamps(scored_tweets, frequency):
+    if not intraday(frequency):
+        return scored_tweets['date']
+    if 'time' not in scored_tweets.columns:
+        raise ValueError("%s sentiment needs the 'time' column of the tweets" % (frequency))
+    times = scored_tweets['time']
+    if times.dtype.kind != 'm':
+        codes, unique_times = pd.factorize(times)
+        times = pd.to_timedelta(unique_times).append(pd.TimedeltaIndex([pd.NaT]))[codes]
+    return pd.to_datetime(scored_tweets['date']) + np.asarray(times)
+
+
+def sentiment_partial_sums(scored_tweets, frequency='daily'):
+    codes, dates = pd.factorize(tweet_timestamps(scored_tweets, frequency), sort=True)
+    total_dates = len(dates)
+    codes[codes < 0] = total_dates
+    label_codes, labels = pd.factorize(scored_tweets['Sentiment'])
+    classes = len(SENTIMENT_CLASSES)
+    label_classes = np.array([SENTIMENT_CLASSES.index(label) if label in SENTIMENT_CLASSES else classes
+                              for label in labels] + [classes])
+    if 'Clean_Tweet' in scored_tweets.columns:
+        counted = text_counted(scored_tweets['Clean_Tweet'])
+    else:
+        counted = scored_tweets['Has_Text'].to_numpy(dtype=bool)
+    counts = np.bincount((codes * (classes + 1) + label_classes[label_codes]) * 2 + counted,
+                         minlength=(total_dates + 1) * (classes + 1) * 2)
+    counts = counts.reshape(total_dates + 1, classes + 1, 2)[:total_dates]
+    sums = pd.DataFrame({
+        'tweets': counts[:, :, 1].sum(axis=1),
+        'positive_sentiment': counts[:, 0].sum(axis=1),
+        'negative_sentiment': counts[:, 1].sum(axis=1),
+        'neutral_sentiment': counts[:, 2].sum(axis=1),
+        'scored_tweets': counts.sum(axis=(1, 2)),
+        'polarity_sum': np.bincount(codes, weights=scored_tweets['Polarity'].to_numpy(dtype=float),
+                                    minlength=total_dates + 1)[:total_dates],
+        'subjectivity_sum': np.bincount(codes, weights=scored_tweets['Subjectivity'].to_numpy(dtype=float),
+                                        minlength=total_dates + 1)[:total_dates],
+    }, index=period_starts(pd.to_datetime(dates), frequency))
+    sums.index.name = 'date'
+    return sums.groupby(level=0)[SUM_COLUMNS].sum()
+
+
+def resample_partial_sums(sums, frequency):
+    sums = sums.copy()
+    sums.index = period_starts(sums.index, frequency)
+    sums.index.name = 'date'
+    return sums.groupby(level=0)[SUM_COLUMNS].sum()
+
+
+def combine_partial_sums(partial_sums):
+    partial_sums = [sums for sums in partial_sums if sums is not None]
+    if not partial_sums:
+        return pd.DataFrame(columns=SUM_COLUMNS)
+    return pd.concat(partial_sums).groupby(level=0)[SUM_COLUMNS].sum()
+
+def sentiment_frame_from_sums(sums):
+    sentiment_df = pd.DataFrame(index=pd.to_datetime(sums.index))
+    sentiment_df.index.name = 'date'
+    for column in ['tweets', 'positive_sentiment', 'negative_sentiment', 'neutral_sentiment']:
+        sentiment_df[column] = sums[column].to_numpy()
+    sentiment_df['average_polarity'] = (sums['polarity_sum'].to_numpy() /
+                                        sums['scored_tweets'].to_numpy())
+    sentiment_df['average_subjectivity'] = (sums['subjectivity_sum'].to_numpy() /
+                                            sums['scored_tweets'].to_numpy())
+    sentiment_df['positive_percentage'] = (sentiment_df.positive_sentiment /
+                                           sentiment_df.tweets)
+    sentiment_df['negative_percentage'] = (
+        sentiment_df.negative_sentiment / sentiment_df.tweets)
+    sentiment_df['objective'] = (sentiment_df.positive_sentiment +
+                                 sentiment_df.negative_sentiment) / (sentiment_df.tweets)
+    sentiment_df['neutral'] = (1 - sentiment_df.objective)
+    return sentiment_df
+
+
+@instrumented
+def sentiment_frame(scored_tweets, frequency='daily'):
+    return sentiment_frame_from_sums(sentiment_partial_sums(scored_tweets, frequency))
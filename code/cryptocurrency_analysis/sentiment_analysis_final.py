@@ -1,33 +1,45 @@
 import pandas as pd
-from textblob import TextBlob
 import re
-import twint
+import os
+from parallel_update import clean_and_score_tweets, DEFAULT_CHUNK_SIZE
+from sentiment_cache import SentimentCache
+from streaming_pipeline import stream_sentiment_dataframe
+from sentiment_aggregation import sentiment_frame
+from aggregate_store import SentimentAggregateStore, update_from_raw_csv
+from columnar_storage import write_frame, read_frame, storage_path
+from project_paths import cleaned_tweet_path, sentiment_dataframe_path, input_data_path, correlation_data_path
+from coin_tagging import COIN_REGISTRY, search_coin, stream_coin_sentiment_frames
+from compact_frames import compact_frame, read_compact_frame
+from pipeline_runner import Stage, run_pipeline
+from timeline_scraper import (scrape_timeline, monthly_windows, combine_windows, window_path,
+                              DEFAULT_SCRAPE_WORKERS, WINDOW_TWEET_LIMIT)
+from tweet_store import store_windows, read_windows
+from graph_stages import correlate_stage, plot_stage, check_correlation_frequency, PLOT_SCRIPT
+from instrumentation import instrumented, enable_instrumentation, metrics_summary, DEFAULT_METRICS_PATH
 
+@instrumented
 def scrape(cryptocoin):
+    import twint
     coin_search = twint.Config()
     coin_search.Search = cryptocoin
     coin_search.Store_csv = True
     coin_search.Hide_output = True
     coin_search.Count = True
-    if cryptocoin == "#Bitcoin":
-        coin_search.Output = "../../output_data/raw_tweet_data/bitcoin_tweets_results_snapshot.csv"
-    else:
-        coin_search.Output = "../../output_data/raw_tweet_data/cardano_tweets_results_snapshot.csv"
+    coin_search.Output = "../../output_data/raw_tweet_data/%s_tweets_results_snapshot.csv" % (search_coin(cryptocoin))
     coin_search.Since = "2021-03-14"
     coin_search.Until = "2021-03-31"
     twint.run.Search(coin_search)
 
+@instrumented
 def extendedScrape(cryptocoin, year, month):
+    import twint
     coin_search = twint.Config()
     coin_search.Search = cryptocoin
     coin_search.Store_csv = True
     coin_search.Hide_output = True
     coin_search.Limit = 5000
     coin_search.Count = True
-    if cryptocoin == "#Bitcoin":
-        coin_search.Output = "../../output_data/raw_tweet_data/bitcoin_tweets_results_extended.csv"
-    else:
-        coin_search.Output = "../../output_data/raw_tweet_data/cardano_tweets_results_extended.csv"
+    coin_search.Output = "../../output_data/raw_tweet_data/%s_tweets_results_extended.csv" % (search_coin(cryptocoin))
     coin_search.Since = "20%s-%s-01" % (year, month)
     coin_search.Until = "20%s-%s-02" % (year, month)
     print(coin_search.Since)
@@ -35,22 +47,38 @@ def extendedScrape(cryptocoin, year, month):
     print(cryptocoin)
     twint.run.Search(coin_search)
 
-def timeline_scrape(search_term):
+@instrumented
+def timeline_scrape(search_term, workers=DEFAULT_SCRAPE_WORKERS):
     months = ['01', '02', '03', '04', '05',
               '06', '07', '08', '09', '10', '11', '12']
     years = ['18', '19', '20', '21']
-    curr_month = 0
-    curr_year = 0
-    i = 0
-    while i < 4:
-        if curr_month < 11:
-            extendedScrape(search_term, years[curr_year], months[curr_month])
-            curr_month += 1
-        else:
-            extendedScrape(search_term, years[curr_year], months[curr_month])
-            curr_month = 0
-            curr_year += 1
-            i += 1
+    windows = monthly_windows(years, months)
+    coin = search_coin(search_term)
+    scrape_timeline(search_term, coin, windows, workers=workers)
+    combine_windows(coin, windows, "../../output_data/raw_tweet_data/%s_tweets_results_extended.csv" % (coin))
+
+DURATION_WINDOWS = {
+    'snapshot': [('2021-03-14', '2021-03-31')],
+    'extended': monthly_windows(['18', '19', '20', '21'],
+                                ['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']),
+}
+
+
+@instrumented
+def duration_scrape(search_term, coin, duration, workers=DEFAULT_SCRAPE_WORKERS):
+    if duration == "snapshot":
+        limit = None
+    else:
+        limit = WINDOW_TWEET_LIMIT
+    results = scrape_timeline(search_term, coin, DURATION_WINDOWS[duration], workers=workers, limit=limit)
+    failed = [since for since, result in results.items() if result == 'failed']
+    if failed:
+        raise RuntimeError('%d %s windows for %s failed (%s), run the scrape again to resume'
+                           % (len(failed), duration, search_term, ', '.join(failed)))
+
+
+def duration_tweets(coin, duration, columns=None, storage='csv'):
+    return read_windows(coin, DURATION_WINDOWS[duration], columns, storage=storage)
 
 def cleaned_tweet(original_tweet):
     original_tweet = re.sub('#Bitcoin', 'Bitcoin', original_tweet)
@@ -64,10 +92,12 @@ def cleaned_tweet(original_tweet):
     return original_tweet
 
 def getSubjectivity(original_tweet):
+    from textblob import TextBlob
     return TextBlob(original_tweet).sentiment.subjectivity
 
 
 def getPolarity(original_tweet):
+    from textblob import TextBlob
     return TextBlob(original_tweet).sentiment.polarity
 
 def getSentiment(score):
@@ -78,118 +108,226 @@ def getSentiment(score):
     else:
         return 'Positive'
 
-def dataframe_update(chosen_dataframe, coin, duration):
-    chosen_dataframe['Clean_Tweet'] = chosen_dataframe['tweet'].apply(
-        cleaned_tweet)
-
-    chosen_dataframe['Subjectivity'] = chosen_dataframe['Clean_Tweet'].apply(
-        getSubjectivity)
-    chosen_dataframe['Polarity'] = chosen_dataframe['Clean_Tweet'].apply(
-        getPolarity)
-
-    chosen_dataframe['Sentiment'] = chosen_dataframe['Polarity'].apply(
-        getSentiment)
-
-    chosen_dataframe = chosen_dataframe[chosen_dataframe['language'] == 'en']
+@instrumented
+def dataframe_update(chosen_dataframe, coin, duration, workers=1, chunk_size=DEFAULT_CHUNK_SIZE, cache=None,
+                     storage='csv', compact=False, keep_text=True, output_path=None):
+    chosen_dataframe = chosen_dataframe[chosen_dataframe['language'] == 'en'].copy()
     chosen_dataframe.reset_index(inplace=True)
 
+    processed = clean_and_score_tweets(
+        chosen_dataframe['tweet'], workers, chunk_size, cache)
+    chosen_dataframe['Clean_Tweet'] = processed['Clean_Tweet']
+    chosen_dataframe['Subjectivity'] = processed['Subjectivity']
+    chosen_dataframe['Polarity'] = processed['Polarity']
+    chosen_dataframe['Sentiment'] = processed['Sentiment']
+
     chosen_dataframe = chosen_dataframe[[
-        'date', 'Clean_Tweet', 'Subjectivity', 'Polarity', 'Sentiment']]
+        'date', 'time', 'Clean_Tweet', 'Subjectivity', 'Polarity', 'Sentiment']]
+    if compact:
+        chosen_dataframe = compact_frame(chosen_dataframe)
 
-    if duration == "snapshot":
-        chosen_dataframe.to_csv('../../output_data/clean_tweet_data/%s_cleaned_tweets_snapshot.csv' %
-                                (coin))
+    if output_path is not None:
+        write_frame(chosen_dataframe, output_path, storage, index=duration == "snapshot")
+    elif duration == "snapshot":
+        write_frame(chosen_dataframe, '../../output_data/clean_tweet_data/%s_cleaned_tweets_snapshot.csv' %
+                    (coin), storage, index=True)
     else:
-        chosen_dataframe.to_csv('../../output_data/clean_tweet_data/%s_cleaned_tweets_extended.csv' %
-                                (coin), index=False)
+        write_frame(chosen_dataframe, '../../output_data/clean_tweet_data/%s_cleaned_tweets_extended.csv' %
+                    (coin), storage)
 
+    if compact and not keep_text:
+        chosen_dataframe = compact_frame(chosen_dataframe, keep_text=False)
     return chosen_dataframe
 
-def sentiment_dataframe_creation(raw_tweet_data, cryptocoin, duration):
-    count_df = raw_tweet_data.groupby(
-        'date')['Clean_Tweet'].count().reset_index(name='tweets')
-    count_df['date'] = pd.to_datetime(count_df['date'])
-    count_df = count_df.set_index('date')
-    positive_df = raw_tweet_data.groupby('date')['Sentiment'].apply(
-        lambda x: (x == 'Positive').sum()).reset_index(name='positive_sentiment')
-    positive_df['date'] = pd.to_datetime(positive_df['date'])
-    positive_df = positive_df.set_index('date')
-    negative_df = raw_tweet_data.groupby('date')['Sentiment'].apply(
-        lambda x: (x == 'Negative').sum()).reset_index(name='negative_sentiment')
-    negative_df['date'] = pd.to_datetime(negative_df['date'])
-    negative_df = negative_df.set_index('date')
-    neutral_df = raw_tweet_data.groupby('date')['Sentiment'].apply(
-        lambda x: (x == 'Neutral').sum()).reset_index(name='neutral_sentiment')
-    neutral_df['date'] = pd.to_datetime(neutral_df['date'])
-    neutral_df = neutral_df.set_index('date')
-
-    average_polarity_df = raw_tweet_data.groupby(
-        'date')['Polarity'].mean().reset_index(name='average_polarity')
-    average_polarity_df['date'] = pd.to_datetime(average_polarity_df['date'])
-    average_polarity_df = average_polarity_df.set_index('date')
-
-    average_subjectivity_df = raw_tweet_data.groupby(
-        'date')['Subjectivity'].mean().reset_index(name='average_subjectivity')
-    average_subjectivity_df['date'] = pd.to_datetime(
-        average_subjectivity_df['date'])
-    average_subjectivity_df = average_subjectivity_df.set_index('date')
-
-    sentiment_df = pd.concat([count_df, positive_df, negative_df,
-                              neutral_df, average_polarity_df, average_subjectivity_df], axis=1)
-    sentiment_df['positive_percentage'] = (sentiment_df.positive_sentiment /
-                                           sentiment_df.tweets)
-    sentiment_df['negative_percentage'] = (
-        sentiment_df.negative_sentiment / sentiment_df.tweets)
-    sentiment_df['objective'] = (sentiment_df.positive_sentiment +
-                                 sentiment_df.negative_sentiment) / (sentiment_df.tweets)
-    sentiment_df['neutral'] = (1 - sentiment_df.objective)
-
-    if duration == 'snapshot':
-        sentiment_df.to_csv(
-            '../../output_data/sentiment_dataframes_csv/%s_sentiment_dataframe_snapshot.csv' % (cryptocoin))
-    else:
-        sentiment_df.to_csv(
-            '../../output_data/sentiment_dataframes_csv/%s_sentiment_dataframe_extended.csv' % (cryptocoin))
+@instrumented
+def sentiment_dataframe_creation(raw_tweet_data, cryptocoin, duration, frequency='daily', storage='csv',
+                                 output_path=None):
+    sentiment_df = sentiment_frame(raw_tweet_data, frequency)
+    if output_path is None:
+        output_path = sentiment_dataframe_path(cryptocoin, duration, frequency)
+    write_frame(sentiment_df, output_path, storage, index=True)
+
+@instrumented
+def streamed_sentiment_dataframe_creation(raw_csv_path, cryptocoin, duration, workers=1, cache=None,
+                                          frequency='daily', storage='csv'):
+    sentiment_df = stream_sentiment_dataframe(
+        raw_csv_path, workers=workers, cache=cache, frequency=frequency)
+    write_frame(sentiment_df, sentiment_dataframe_path(
+        cryptocoin, duration, frequency), storage, index=True)
+
+@instrumented
+def incremental_sentiment_dataframe_creation(raw_csv_path, cryptocoin, duration, store, workers=1, cache=None,
+                                             frequency='daily', storage='csv'):
+    dataset = '%s_%s' % (cryptocoin, duration)
+    store.check_frequency(frequency)
+    update_from_raw_csv(store, dataset, raw_csv_path, workers=workers, cache=cache, rebuild=True)
+    sentiment_df = store.sentiment_frame(dataset, frequency)
+    write_frame(sentiment_df, sentiment_dataframe_path(
+        cryptocoin, duration, frequency), storage, index=True)
+
+@instrumented
+def shared_sentiment_dataframe_creation(raw_csv_path, duration, registry=COIN_REGISTRY, workers=1, cache=None,
+                                        frequency='daily', storage='csv'):
+    coin_frames = stream_coin_sentiment_frames(
+        raw_csv_path, registry, workers=workers, cache=cache, frequency=frequency)
+    for cryptocoin, sentiment_df in coin_frames.items():
+        write_frame(sentiment_df, sentiment_dataframe_path(
+            cryptocoin, duration, frequency), storage, index=True)
 
 def tweet_volume_console_print(cleaned_tweet_dataframe):
     print("Number of rows ", len(cleaned_tweet_dataframe.index))
 
-scrape("#Bitcoin")
-scrape("#Cardano")
+PIPELINE_COINS = {'bitcoin': '#Bitcoin', 'cardano': '#Cardano'}
+
+
+@instrumented
+def clean_stage(coin, duration, storage, compact=False, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    store_windows(coin, DURATION_WINDOWS[duration], storage=storage)
+    cache = SentimentCache()
+    try:
+        dataframe_update(duration_tweets(coin, duration, ['date', 'time', 'tweet', 'language'], storage),
+                         coin, duration, workers, chunk_size, cache=cache, storage=storage, compact=compact)
+    finally:
+        cache.close()
+
+
+@instrumented
+def aggregate_stage(cleaned_csv_path, coin, duration, frequency, storage, compact=False):
+    if compact:
+        cleaned_tweets_df = read_compact_frame(cleaned_csv_path, storage)
+    else:
+        cleaned_tweets_df = read_frame(cleaned_csv_path, storage=storage, lineterminator='\n')
+    sentiment_dataframe_creation(cleaned_tweets_df, coin, duration, frequency, storage)
+
+
+def pipeline_stages(storage='csv', frequency='daily', compact=False, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    check_correlation_frequency(frequency)
+    stages = []
+    plot_inputs = [PLOT_SCRIPT]
+    for coin, search_term in PIPELINE_COINS.items():
+        for duration in ['snapshot', 'extended']:
+            window_paths = [window_path(coin, since) for since, until in DURATION_WINDOWS[duration]]
+            cleaned_csv_path = cleaned_tweet_path(coin, duration)
+            cleaned_path = storage_path(cleaned_csv_path, storage)
+            sentiment_path = storage_path(sentiment_dataframe_path(coin, duration, frequency), storage)
+            stages.append(Stage('scrape_%s_%s' % (coin, duration), duration_scrape,
+                                outputs=window_paths, arguments=(search_term, coin, duration)))
+            stages.append(Stage('clean_%s_%s' % (coin, duration), clean_stage,
+                                inputs=window_paths, outputs=[cleaned_path],
+                                arguments=(coin, duration, storage, compact, workers, chunk_size)))
+            stages.append(Stage('aggregate_%s_%s' % (coin, duration), aggregate_stage,
+                                inputs=[cleaned_path], outputs=[sentiment_path],
+                                arguments=(cleaned_csv_path, coin, duration, frequency, storage, compact)))
+            stages.append(Stage('correlate_%s_%s' % (coin, duration), correlate_stage,
+                                inputs=[sentiment_path] + [input_data_path(coin, name, duration)
+                                                           for name in ['cp', 'tv', 'gt']],
+                                outputs=[correlation_data_path(coin, duration)],
+                                arguments=(coin, duration, frequency, storage)))
+            plot_inputs += [cleaned_path, sentiment_path, correlation_data_path(coin, duration)]
+            plot_inputs += [input_data_path(coin, name, duration) for name in ['cp', 'tv', 'gt']]
+    plot_outputs = ['../../output_data/plots/%s/%s_%s_%s.png' % (folder, coin, name, duration)
+                    for folder, name in [('coin_price', 'price'), ('polarity', 'polarity_dist'),
+                                         ('objectivity', 'object_neut_bar'),
+                                         ('sentiment_price', 'price_vs_polarity'),
+                                         ('tweet_volume_price', 'price_vs_tweet'),
+                                         ('google_trend_price', 'price_vs_google'),
+                                         ('tweet_volume', 'tweet_volume'), ('correlation', 'correlation')]
+                    for coin in PIPELINE_COINS for duration in ['snapshot', 'extended']]
+    plot_outputs += ['../../output_data/plots/correlation/%s_%s_correlation_extended.png' % (coin, name)
+                     for name in ['lag', 'rolling'] for coin in PIPELINE_COINS]
+    stages.append(Stage('plot', plot_stage, inputs=plot_inputs, outputs=plot_outputs,
+                        arguments=(PLOT_SCRIPT, storage, frequency)))
+    return stages
+
+if __name__ == "__main__":
+    WORKERS = os.cpu_count()
+    STREAMING = False
+    INCREMENTAL = False
+    SHARED = False
+    STORAGE = 'csv'
+    PIPELINE = True
+    COMPACT = False
+    INSTRUMENT = False
+    PROFILE = []
+
+    if INSTRUMENT:
+        enable_instrumentation(DEFAULT_METRICS_PATH, PROFILE)
+
+    if PIPELINE:
+        print("Pipeline ", run_pipeline(pipeline_stages(STORAGE, compact=COMPACT), workers=WORKERS))
+    else:
+        CACHE = SentimentCache()
+        scrape("#Bitcoin")
+        scrape("#Cardano")
 
 
-timeline_scrape("#Cardano")
-timeline_scrape("#Bitcoin")
+        timeline_scrape("#Cardano")
+        timeline_scrape("#Bitcoin")
 
 
-bitcoin_tweets_snapshot_df = pd.read_csv(
-    "../../output_data/raw_tweet_data/btc_tweets_results_snapshot.csv")
-cardano_tweets_snapshot_df = pd.read_csv(
-    "../../output_data/raw_tweet_data/ada_tweets_results_snapshot.csv")
-bitcoin_tweets__extended_df = pd.read_csv(
-    "../../output_data/raw_tweet_data/btc_tweets_results_extended.csv")
-cardano_tweets_extended_df = pd.read_csv(
-    "../../output_data/raw_tweet_data/ada_tweets_results_extended.csv")
+        if INCREMENTAL:
+            STORE = SentimentAggregateStore()
+            incremental_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/btc_tweets_results_snapshot.csv", "bitcoin", "snapshot", STORE, WORKERS, CACHE, storage=STORAGE)
+            incremental_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/ada_tweets_results_snapshot.csv", "cardano", "snapshot", STORE, WORKERS, CACHE, storage=STORAGE)
+            incremental_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/btc_tweets_results_extended.csv", "bitcoin", "extended", STORE, WORKERS, CACHE, storage=STORAGE)
+            incremental_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/ada_tweets_results_extended.csv", "cardano", "extended", STORE, WORKERS, CACHE, storage=STORAGE)
+            STORE.close()
+        elif SHARED:
+            shared_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/shared_tweets_results_snapshot.csv", "snapshot", COIN_REGISTRY, WORKERS, CACHE, storage=STORAGE)
+            shared_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/shared_tweets_results_extended.csv", "extended", COIN_REGISTRY, WORKERS, CACHE, storage=STORAGE)
+        elif STREAMING:
+            streamed_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/btc_tweets_results_snapshot.csv", "bitcoin", "snapshot", WORKERS, CACHE, storage=STORAGE)
+            streamed_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/ada_tweets_results_snapshot.csv", "cardano", "snapshot", WORKERS, CACHE, storage=STORAGE)
+            streamed_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/btc_tweets_results_extended.csv", "bitcoin", "extended", WORKERS, CACHE, storage=STORAGE)
+            streamed_sentiment_dataframe_creation(
+                "../../output_data/raw_tweet_data/ada_tweets_results_extended.csv", "cardano", "extended", WORKERS, CACHE, storage=STORAGE)
+        else:
+            bitcoin_tweets_snapshot_df = pd.read_csv(
+                "../../output_data/raw_tweet_data/btc_tweets_results_snapshot.csv")
+            cardano_tweets_snapshot_df = pd.read_csv(
+                "../../output_data/raw_tweet_data/ada_tweets_results_snapshot.csv")
+            bitcoin_tweets__extended_df = pd.read_csv(
+                "../../output_data/raw_tweet_data/btc_tweets_results_extended.csv")
+            cardano_tweets_extended_df = pd.read_csv(
+                "../../output_data/raw_tweet_data/ada_tweets_results_extended.csv")
+
+            dataframe_update(bitcoin_tweets_snapshot_df, "bitcoin", "snapshot", WORKERS, cache=CACHE, storage=STORAGE,
+                             compact=COMPACT)
+            dataframe_update(cardano_tweets_snapshot_df, "cardano", "snapshot", WORKERS, cache=CACHE, storage=STORAGE,
+                             compact=COMPACT)
+            dataframe_update(bitcoin_tweets__extended_df, "bitcoin", "extended", WORKERS, cache=CACHE, storage=STORAGE,
+                             compact=COMPACT)
+            dataframe_update(cardano_tweets_extended_df, "cardano", "extended", WORKERS, cache=CACHE, storage=STORAGE,
+                             compact=COMPACT)
 
-dataframe_update(bitcoin_tweets_snapshot_df, "bitcoin", "snapshot")
-dataframe_update(cardano_tweets_snapshot_df, "cardano", "snapshot")
-dataframe_update(bitcoin_tweets__extended_df, "bitcoin", "extended")
-dataframe_update(cardano_tweets_extended_df, "cardano", "extended")
 
+            bitcoin_cleaned_tweets_snapshot_df = read_frame(
+                "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_snapshot.csv", storage=STORAGE, lineterminator='\n')
+            cardano_cleaned_tweets_snapshot_df = read_frame(
+                "../../output_data/clean_tweet_data/cardano_cleaned_tweets_snapshot.csv", storage=STORAGE, lineterminator='\n')
+            bitcoin_cleaned_tweets_extended_df = read_frame(
+                "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_extended.csv", storage=STORAGE, lineterminator='\n')
+            cardano_cleaned_tweets_extended_df = read_frame(
+                "../../output_data/clean_tweet_data/cardano_cleaned_tweets_extended.csv", storage=STORAGE, lineterminator='\n')
 
-bitcoin_cleaned_tweets_snapshot_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_snapshot.csv", lineterminator='\n')
-cardano_cleaned_tweets_snapshot_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/cardano_cleaned_tweets_snapshot.csv", lineterminator='\n')
-bitcoin_cleaned_tweets_extended_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_extended.csv", lineterminator='\n')
-cardano_cleaned_tweets_extended_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/cardano_cleaned_tweets_extended.csv",lineterminator='\n')
 
+            sentiment_dataframe_creation(bitcoin_cleaned_tweets_snapshot_df, "bitcoin", "snapshot", storage=STORAGE)
+            sentiment_dataframe_creation(cardano_cleaned_tweets_snapshot_df, "cardano", "snapshot", storage=STORAGE)
+            sentiment_dataframe_creation(
+                bitcoin_cleaned_tweets_extended_df, "bitcoin", "extended", storage=STORAGE)
+            sentiment_dataframe_creation(
+                cardano_cleaned_tweets_extended_df, "cardano", "extended", storage=STORAGE)
 
-sentiment_dataframe_creation(bitcoin_cleaned_tweets_snapshot_df, "bitcoin", "snapshot")
-sentiment_dataframe_creation(cardano_cleaned_tweets_snapshot_df, "cardano", "snapshot")
-sentiment_dataframe_creation(
-    bitcoin_cleaned_tweets_extended_df, "bitcoin", "extended")
-sentiment_dataframe_creation(
-    cardano_cleaned_tweets_extended_df, "cardano", "extended")
+        print("Sentiment cache ", CACHE.report())
+        CACHE.close()
+    if INSTRUMENT:
+        print("Slowest steps ", metrics_summary(DEFAULT_METRICS_PATH).head(10))
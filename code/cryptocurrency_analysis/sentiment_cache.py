@@ -0,0 +1,149 @@
+import os
+import time
+import hashlib
+import sqlite3
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from sentiment_scoring import score_tweets, sentiment_labels, SCORER_VERSION
+
+DEFAULT_CACHE_PATH = '../../output_data/sentiment_cache/sentiment_cache.sqlite'
+DEFAULT_MEMORY_ENTRIES = 500000
+DEFAULT_DISK_BYTES = 2 * 1024 ** 3
+SQLITE_PARAMETERS = 900
+SQLITE_TIMEOUT = 60
+
+
+def cache_key(clean_tweet, scorer_version=SCORER_VERSION):
+    return hashlib.blake2b((scorer_version + '\x00' + clean_tweet).encode('utf-8'),
+                           digest_size=16).digest()
+
+class SentimentCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, memory_entries=DEFAULT_MEMORY_ENTRIES,
+                 disk_bytes=DEFAULT_DISK_BYTES, scorer_version=SCORER_VERSION):
+        self.memory = OrderedDict()
+        self.memory_entries = memory_entries
+        self.disk_bytes = disk_bytes
+        self.scorer_version = scorer_version
+        self.stats = {'memory_hits': 0, 'disk_hits': 0,
+                      'batch_duplicates': 0, 'misses': 0}
+        self.connection = None
+        if path is not None:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.connection = sqlite3.connect(path, timeout=SQLITE_TIMEOUT)
+            with self.connection:
+                self.connection.execute(
+                    'CREATE TABLE IF NOT EXISTS scores (key BLOB PRIMARY KEY, polarity REAL NOT NULL, '
+                    'subjectivity REAL NOT NULL, last_used REAL NOT NULL) WITHOUT ROWID')
+                self.connection.execute(
+                    'CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used)')
+
+    def hits(self):
+        return (self.stats['memory_hits'] + self.stats['disk_hits']
+                + self.stats['batch_duplicates'])
+
+    def report(self):
+        return dict(self.stats, hits=self.hits())
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def remember(self, key, score):
+        self.memory[key] = score
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def lookup(self, keys):
+        found = {}
+        remaining = []
+        for key in keys:
+            score = self.memory.get(key)
+            if score is None:
+                remaining.append(key)
+            else:
+                self.memory.move_to_end(key)
+                found[key] = score
+        memory_found = len(found)
+        if self.connection is None:
+            return found, memory_found
+        for start in range(0, len(remaining), SQLITE_PARAMETERS):
+            batch = remaining[start:start + SQLITE_PARAMETERS]
+            rows = self.connection.execute(
+                'SELECT key, polarity, subjectivity FROM scores WHERE key IN (%s)'
+                % ','.join('?' * len(batch)), batch)
+            for key, polarity, subjectivity in rows:
+                found[key] = (polarity, subjectivity)
+                self.remember(key, (polarity, subjectivity))
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                'UPDATE scores SET last_used = ? WHERE key = ?',
+                [(now, key) for key in found])
+        return found, memory_found
+
+    def store(self, scores):
+        for key, score in scores.items():
+            self.remember(key, score)
+        if self.connection is None:
+            return
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO scores (key, polarity, subjectivity, last_used) VALUES (?, ?, ?, ?)',
+                [(key, polarity, subjectivity, now)
+                 for key, (polarity, subjectivity) in scores.items()])
+        self.evict()
+
+    def disk_size(self):
+        page_size = self.connection.execute('PRAGMA page_size').fetchone()[0]
+        page_count = self.connection.execute('PRAGMA page_count').fetchone()[0]
+        free_pages = self.connection.execute(
+            'PRAGMA freelist_count').fetchone()[0]
+        return (page_count - free_pages) * page_size
+
+    def evict(self):
+        size = self.disk_size()
+        if size <= self.disk_bytes:
+            return
+        rows = self.connection.execute(
+            'SELECT COUNT(*) FROM scores').fetchone()[0]
+        excess = int(rows * (1 - 0.9 * self.disk_bytes / size)) + 1
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY last_used LIMIT ?)',
+                (excess,))
+
+    def score_tweets(self, clean_tweets, scorer=score_tweets):
+        codes, uniques = pd.factorize(
+            np.asarray(list(clean_tweets), dtype=object))
+        keys = [cache_key(tweet, self.scorer_version) for tweet in uniques]
+        found, memory_found = self.lookup(keys)
+        missing = [position for position, key in enumerate(keys)
+                   if key not in found]
+        if missing:
+            scored = scorer([uniques[position] for position in missing])
+            new_scores = {keys[position]: (float(polarity), float(subjectivity))
+                          for position, polarity, subjectivity in
+                          zip(missing, scored['Polarity'], scored['Subjectivity'])}
+            self.store(new_scores)
+            found.update(new_scores)
+        self.stats['memory_hits'] += memory_found
+        self.stats['disk_hits'] += len(keys) - len(missing) - memory_found
+        self.stats['misses'] += len(missing)
+        self.stats['batch_duplicates'] += len(codes) - len(keys)
+        unique_scores = np.array([found[key] for key in keys],
+                                 dtype=float).reshape(len(keys), 2)
+        polarity = unique_scores[codes, 0]
+        subjectivity = unique_scores[codes, 1]
+        if isinstance(clean_tweets, pd.Series):
+            scores_index = clean_tweets.index
+        else:
+            scores_index = None
+        scores = pd.DataFrame({'Subjectivity': subjectivity,
+                               'Polarity': polarity}, index=scores_index)
+        scores['Sentiment'] = sentiment_labels(polarity)
+        return scores
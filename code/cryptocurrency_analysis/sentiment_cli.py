@@ -0,0 +1,210 @@
+import os
+import sys
+import argparse
+from datetime import date
+
+COINS = {'bitcoin': '#Bitcoin', 'cardano': '#Cardano'}
+DURATIONS = ['snapshot', 'extended']
+STORAGE_FORMATS = ['csv', 'parquet', 'arrow']
+RAW_COLUMNS = ['date', 'time', 'tweet', 'language']
+DEFAULT_PROJECT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def day(value):
+    date.fromisoformat(value)
+    return value
+
+
+def selected_runs(args):
+    return [(coin, duration) for coin in args.coin or list(COINS) for duration in args.duration or DURATIONS]
+
+
+def range_windows(since, until):
+    import pandas as pd
+    month_starts = [start.strftime('%Y-%m-%d') for start in pd.date_range(since, until, freq='MS')]
+    boundaries = [since] + [start for start in month_starts if since < start < until] + [until]
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def command_windows(args, duration):
+    if args.since is not None:
+        return range_windows(args.since, args.until)
+    from sentiment_analysis_final import DURATION_WINDOWS
+    return DURATION_WINDOWS[duration]
+
+
+def in_date_range(chosen_dataframe, since, until):
+    if since is None:
+        return chosen_dataframe
+    import pandas as pd
+    dates = pd.to_datetime(chosen_dataframe['date'])
+    return chosen_dataframe[(dates >= since) & (dates < until)]
+
+
+def output_directory(path):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+def scrape_command(args):
+    from timeline_scraper import scrape_timeline, DEFAULT_SCRAPE_WORKERS, WINDOW_TWEET_LIMIT
+    for coin, duration in selected_runs(args):
+        if args.limit is None and duration == 'extended' and args.since is None:
+            limit = WINDOW_TWEET_LIMIT
+        else:
+            limit = args.limit
+        results = scrape_timeline(COINS[coin], coin, command_windows(args, duration),
+                                  workers=args.workers or DEFAULT_SCRAPE_WORKERS, limit=limit)
+        failed = [since for since, result in results.items() if result == 'failed']
+        if failed:
+            raise RuntimeError('%d windows for %s failed (%s), run the scrape again to resume'
+                               % (len(failed), coin, ', '.join(failed)))
+        print("Scraped ", coin, duration, results)
+
+
+def clean_command(args):
+    import pandas as pd
+    from sentiment_analysis_final import dataframe_update
+    from sentiment_cache import SentimentCache
+    from tweet_store import store_windows, read_windows
+    from project_paths import cleaned_tweet_path
+    for coin, duration in selected_runs(args):
+        output_path = args.output or cleaned_tweet_path(coin, duration)
+        if args.input is not None:
+            tweets = in_date_range(pd.read_csv(args.input, usecols=RAW_COLUMNS), args.since, args.until)
+        else:
+            windows = command_windows(args, duration)
+            store_windows(coin, windows, storage=args.storage)
+            tweets = read_windows(coin, windows, RAW_COLUMNS, storage=args.storage)
+        cache = SentimentCache()
+        try:
+            cleaned = dataframe_update(tweets, coin, duration, args.workers or os.cpu_count(), cache=cache,
+                                       storage=args.storage, compact=args.compact,
+                                       output_path=output_directory(output_path))
+        finally:
+            cache.close()
+        print("Cleaned ", coin, duration, len(cleaned))
+
+
+def aggregate_command(args):
+    from columnar_storage import read_frame, write_frame
+    from compact_frames import read_compact_frame
+    from sentiment_aggregation import sentiment_frame
+    from project_paths import cleaned_tweet_path, sentiment_dataframe_path
+    for coin, duration in selected_runs(args):
+        input_path = args.input or cleaned_tweet_path(coin, duration)
+        output_path = args.output or sentiment_dataframe_path(coin, duration, args.frequency)
+        if args.compact:
+            cleaned_tweets_df = read_compact_frame(input_path, args.storage)
+        else:
+            cleaned_tweets_df = read_frame(input_path, storage=args.storage, lineterminator='\n')
+        cleaned_tweets_df = in_date_range(cleaned_tweets_df, args.since, args.until)
+        sentiment_df = sentiment_frame(cleaned_tweets_df, args.frequency)
+        write_frame(sentiment_df, output_directory(output_path), args.storage, index=True)
+        print("Aggregated ", coin, duration, len(sentiment_df))
+
+
+def correlate_command(args):
+    from graph_stages import correlate_stage
+    for coin, duration in selected_runs(args):
+        correlate_stage(coin, duration, args.frequency, args.storage)
+        print("Correlated ", coin, duration)
+
+
+def plot_command(args):
+    from graph_stages import plot_stage, PLOT_SCRIPT
+    plot_stage(PLOT_SCRIPT, args.storage, args.frequency)
+
+
+def all_command(args):
+    from sentiment_analysis_final import pipeline_stages
+    from pipeline_runner import run_pipeline
+    stages = pipeline_stages(args.storage, args.frequency, args.compact, args.workers or 1)
+    print("Pipeline ", run_pipeline(stages, workers=args.workers or os.cpu_count(), force=args.force))
+
+def command_parser():
+    parser = argparse.ArgumentParser(prog='sentiment_cli.py',
+                                     description='Scrape, clean, score, aggregate and plot cryptocurrency tweet sentiment.')
+    parser.add_argument('--project', default=DEFAULT_PROJECT,
+                        help='folder holding input_data and output_data (default: %(default)s)')
+    parser.add_argument('--storage', choices=STORAGE_FORMATS, default='csv',
+                        help='format of the cleaned tweets and sentiment dataframes (default: csv)')
+    parser.add_argument('--metrics', help='switch on instrumentation and add the measurements to this file')
+    parser.add_argument('--profile', action='append', default=[], help='step to run under cProfile (repeatable)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    selection = argparse.ArgumentParser(add_help=False)
+    selection.add_argument('--coin', action='append', choices=list(COINS),
+                           help='coin to run (repeatable, default: all)')
+    selection.add_argument('--duration', action='append', choices=DURATIONS,
+                           help='duration to run (repeatable, default: all)')
+    date_range = argparse.ArgumentParser(add_help=False)
+    date_range.add_argument('--since', type=day, help='first day of tweets to use (YYYY-MM-DD)')
+    date_range.add_argument('--until', type=day, help='day after the last day of tweets to use (YYYY-MM-DD)')
+    files = argparse.ArgumentParser(add_help=False)
+    files.add_argument('--input', help='file to read instead of the project file')
+    files.add_argument('--output', help='file to write instead of the project file')
+    workers = argparse.ArgumentParser(add_help=False)
+    workers.add_argument('--workers', type=int, help='number of processes (or scrape threads) to use')
+    frequency = argparse.ArgumentParser(add_help=False)
+    frequency.add_argument('--frequency', default='daily',
+                           help="period of the sentiment dataframe: hourly, daily, weekly, monthly or a pandas "
+                                "alias such as '4h', '2D' or 'MS' (default: daily)")
+    compact = argparse.ArgumentParser(add_help=False)
+    compact.add_argument('--compact', action='store_true', help='keep the scored tweets in compact types')
+
+    scrape = commands.add_parser('scrape', parents=[selection, date_range, workers], help='scrape tweets with twint')
+    scrape.add_argument('--limit', type=int, help='most tweets to scrape per window')
+    scrape.set_defaults(function=scrape_command)
+    clean = commands.add_parser('clean', parents=[selection, date_range, files, workers, compact],
+                                help='clean and score the scraped tweets')
+    clean.set_defaults(function=clean_command)
+    aggregate = commands.add_parser('aggregate', parents=[selection, date_range, files, frequency, compact],
+                                    help='create the sentiment dataframes from the cleaned tweets')
+    aggregate.set_defaults(function=aggregate_command)
+    correlate = commands.add_parser('correlate', parents=[selection, frequency],
+                                    help='line up the sentiment with the price, tweet volume and Google Trends data')
+    correlate.set_defaults(function=correlate_command)
+    plot = commands.add_parser('plot', parents=[frequency], help='plot the graphs')
+    plot.set_defaults(function=plot_command)
+    everything = commands.add_parser('all', parents=[workers, frequency, compact],
+                                     help='run every stage of the pipeline that is out of date')
+    everything.add_argument('--force', action='store_true', help='run every stage, even if it is up to date')
+    everything.set_defaults(function=all_command)
+    return parser
+
+
+def check_options(parser, args):
+    if getattr(args, 'workers', None) is not None and args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.command in ('correlate', 'all') and args.frequency != 'daily':
+        parser.error('%s needs daily sentiment, as the price data is daily' % (args.command))
+    if (getattr(args, 'since', None) is None) != (getattr(args, 'until', None) is None):
+        parser.error('--since and --until must be given together')
+    if getattr(args, 'since', None) is not None:
+        if args.since >= args.until:
+            parser.error('--since must be before --until')
+        if len(args.duration or DURATIONS) > 1:
+            parser.error('--since and --until need a single --duration, which names the files written')
+    if getattr(args, 'input', None) is not None or getattr(args, 'output', None) is not None:
+        if len(selected_runs(args)) > 1:
+            parser.error('--input and --output need a single --coin and --duration')
+
+def main(argv=None):
+    parser = command_parser()
+    args = parser.parse_args(argv)
+    check_options(parser, args)
+    for option in ['input', 'output', 'metrics']:
+        if getattr(args, option, None) is not None:
+            setattr(args, option, os.path.abspath(getattr(args, option)))
+    working_directory = os.path.join(os.path.abspath(args.project), 'code', 'cryptocurrency_analysis')
+    os.makedirs(working_directory, exist_ok=True)
+    os.chdir(working_directory)
+    if args.metrics is not None:
+        from instrumentation import enable_instrumentation
+        enable_instrumentation(args.metrics, args.profile)
+    args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
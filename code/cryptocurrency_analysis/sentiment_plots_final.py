@@ -1,357 +1,423 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
+import os
+from price_alignment import PricePyramid
+from data_catalog import DataCatalog
+from plot_renderer import new_figure, save_figure, render_charts
+from decimation import line_points, line_indices, decimated, bar_count, bucket_bars
+from correlation_engine import cached_correlations, correlation_matrix, lag_table
+from project_paths import sentiment_dataframe_path
 
 def coin_prices(chosen_dataframe, duration, search_term):
     df = pd.DataFrame(chosen_dataframe, columns=['Date', 'Close'])
-    df.plot.line(x='Date', y='Close', color='blue')
-    plt.ylabel('Close Price ($USD)')
-    plt.title("%s Prices" % (search_term.capitalize()))
-    plt.xticks(rotation=45)
+    fig = new_figure()
+    ax = fig.add_subplot()
+    df = df.iloc[line_indices(df.Date, df.Close, line_points(ax))]
+    df.plot.line(x='Date', y='Close', color='blue', ax=ax)
+    ax.set_ylabel('Close Price ($USD)')
+    ax.set_title("%s Prices" % (search_term.capitalize()))
+    ax.tick_params(axis='x', labelrotation=45)
     if duration == "snapshot":
-        plt.savefig('../../output_data/plots/coin_price/%s_price_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        save_figure(fig, '../../output_data/plots/coin_price/%s_price_snapshot.png' %
+                    (search_term))
     else:
-        plt.savefig('../../output_data/plots/coin_price/%s_price_extended.png' %
-                    (search_term), bbox_inches='tight')
+        save_figure(fig, '../../output_data/plots/coin_price/%s_price_extended.png' %
+                    (search_term))
 
 def polarity_hist(chosen_dataframe, duration, search_term):
     total_bins = 60
-    plt.hist(
+    fig = new_figure()
+    ax = fig.add_subplot()
+    ax.hist(
         chosen_dataframe.Polarity, total_bins, facecolor='Purple')
-    plt.xlabel('Polarity')
-    plt.ylabel('Volume of Tweets')
+    ax.set_xlabel('Polarity')
+    ax.set_ylabel('Volume of Tweets')
     if duration == "snapshot":
-        plt.title('%s Polarity Distribution Mar 2021' %
-                  (search_term.capitalize()))
-        plt.savefig('../../output_data/plots/polarity/%s_polarity_dist_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        ax.set_title('%s Polarity Distribution Mar 2021' %
+                     (search_term.capitalize()))
+        save_figure(fig, '../../output_data/plots/polarity/%s_polarity_dist_snapshot.png' %
+                    (search_term))
     else:
-        plt.title('%s Polarity Distribution 2018-2021' %
-                  (search_term.capitalize()))
-        plt.savefig('../../output_data/plots/polarity/%s_polarity_dist_extended.png' %
-                    (search_term), bbox_inches='tight')
+        ax.set_title('%s Polarity Distribution 2018-2021' %
+                     (search_term.capitalize()))
+        save_figure(fig, '../../output_data/plots/polarity/%s_polarity_dist_extended.png' %
+                    (search_term))
 
 def objec_neut_bar(chosen_dataframe, duration, search_term):
-    plt.figure(figsize=(12, 10))
-    pos_bar = plt.barh(chosen_dataframe.date,
-                       (chosen_dataframe.positive_percentage), color='blue')
-    neg_bar = plt.barh(chosen_dataframe.date,
-                       (chosen_dataframe.negative_percentage), left=chosen_dataframe.positive_percentage,  color='red')
-    neut_bar = plt.barh(chosen_dataframe.date, chosen_dataframe.neutral, left=(chosen_dataframe.positive_percentage + chosen_dataframe.negative_percentage),
-                        color='grey')
-    plt.legend([pos_bar, neg_bar, neut_bar], ["Positive Tweets", "Negative Tweets",
-                                              "Neutral Tweets"], title="% Breakdown", loc="upper right")
+    fig = new_figure(figsize=(12, 10))
+    ax = fig.add_subplot()
+    chosen_dataframe = bucket_bars(chosen_dataframe, ['positive_percentage', 'negative_percentage', 'neutral'],
+                                   bar_count(ax), weights='tweets')
+    dates = chosen_dataframe.date.dt.strftime('%Y-%m-%d')
+    pos_bar = ax.barh(dates,
+                      (chosen_dataframe.positive_percentage), color='blue')
+    neg_bar = ax.barh(dates,
+                      (chosen_dataframe.negative_percentage), left=chosen_dataframe.positive_percentage,  color='red')
+    neut_bar = ax.barh(dates, chosen_dataframe.neutral, left=(chosen_dataframe.positive_percentage + chosen_dataframe.negative_percentage),
+                       color='grey')
+    ax.legend([pos_bar, neg_bar, neut_bar], ["Positive Tweets", "Negative Tweets",
+                                             "Neutral Tweets"], title="% Breakdown", loc="upper right")
     if duration == "snapshot":
-        plt.title('%s Ojective vs Neutral Distribution Mar 2021' %
-                  (search_term.capitalize()))
-        plt.savefig('../../output_data/plots/objectivity/%s_object_neut_bar_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        ax.set_title('%s Ojective vs Neutral Distribution Mar 2021' %
+                     (search_term.capitalize()))
+        save_figure(fig, '../../output_data/plots/objectivity/%s_object_neut_bar_snapshot.png' %
+                    (search_term))
     else:
-        plt.title('%s Ojective vs Neutral Distribution 2018-2021' %
-                  search_term.capitalize())
-        plt.savefig('../../output_data/plots/objectivity/%s_object_neut_bar_extended.png' %
-                    (search_term), bbox_inches='tight')
+        ax.set_title('%s Ojective vs Neutral Distribution 2018-2021' %
+                     search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/objectivity/%s_object_neut_bar_extended.png' %
+                    (search_term))
 
 def sentiment_price_graph(chosen_dataframe, chosen_prices_dataframe, duration, search_term):
-    fig, ax1 = plt.subplots()
-    plt.xticks(rotation=45)
+    fig = new_figure()
+    ax1 = fig.add_subplot()
+    ax1.tick_params(axis='x', labelrotation=45)
     ax1.set_ylabel('Average Polarity', color='blue')
-    ax1.plot(chosen_dataframe.date,
-             chosen_dataframe.average_polarity, color='blue')
+    ax1.plot(*decimated(chosen_dataframe.date,
+                        chosen_dataframe.average_polarity, line_points(ax1)), color='blue')
     ax2 = ax1.twinx()
     ax2.set_ylabel('Close Price ($USD)', color='green')
-    ax2.plot(chosen_dataframe.date,
-             chosen_prices_dataframe.Close, color='green')
+    ax2.plot(*decimated(chosen_dataframe.date,
+                        chosen_prices_dataframe.Close, line_points(ax2)), color='green')
     fig.tight_layout()
     if duration == "snapshot":
         ax1.set_xlabel('Date')
-        plt.title('%s Average Polarity vs Price Mar 2021' %
-                  search_term.capitalize())
-        plt.savefig('../../output_data/plots/sentiment_price/%s_price_vs_polarity_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        ax2.set_title('%s Average Polarity vs Price Mar 2021' %
+                      search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/sentiment_price/%s_price_vs_polarity_snapshot.png' %
+                    (search_term))
     else:
-        plt.xticks([])
-        plt.title('%s Average Polarity vs Price Jan 2018 - Aug 2021' %
-                  search_term.capitalize())
+        ax2.set_xticks([])
+        ax2.set_title('%s Average Polarity vs Price Jan 2018 - Aug 2021' %
+                      search_term.capitalize())
         ax1.set_xlabel('January 2018 - August 2021')
-        plt.savefig('../../output_data/plots/sentiment_price/%s_price_vs_polarity_extended.png' %
-                    (search_term), bbox_inches='tight')
+        save_figure(fig, '../../output_data/plots/sentiment_price/%s_price_vs_polarity_extended.png' %
+                    (search_term))
 
 def price_vs_tweet_volume(chosen_dataframe, chosen_prices_dataframe, duration, search_term):
-    fig, ax1 = plt.subplots()
-    plt.xticks(rotation=45)
+    fig = new_figure()
+    ax1 = fig.add_subplot()
+    ax1.tick_params(axis='x', labelrotation=45)
     ax1.set_xlabel('Date')
     ax1.set_ylabel('Tweet Volume', color='blue')
-    ax1.plot(chosen_dataframe.Date,
-             chosen_dataframe.Tweets, color='blue')
+    ax1.plot(*decimated(chosen_dataframe.Date,
+                        chosen_dataframe.Tweets, line_points(ax1)), color='blue')
     ax2 = ax1.twinx()
     ax2.set_ylabel('Close Price ($USD)', color='green')
-    ax2.plot(chosen_dataframe.Date,
-             chosen_prices_dataframe.Close, color='green')
+    ax2.plot(*decimated(chosen_dataframe.Date,
+                        chosen_prices_dataframe.Close, line_points(ax2)), color='green')
     fig.tight_layout()
     if duration == "snapshot":
-        plt.title('%s Tweet Volume vs Price Mar 2021' %
-                  search_term.capitalize())
-        plt.savefig('../../output_data/plots/tweet_volume_price/%s_price_vs_tweet_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        ax2.set_title('%s Tweet Volume vs Price Mar 2021' %
+                      search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/tweet_volume_price/%s_price_vs_tweet_snapshot.png' %
+                    (search_term))
     else:
-        plt.xticks([])
-        plt.title('%s Tweet Volume vs Price Jan 2018 - Aug 2021' %
-                  search_term.capitalize())
-        plt.savefig('../../output_data/plots/tweet_volume_price/%s_price_vs_tweet_extended.png' %
-                    (search_term), bbox_inches='tight')
+        ax2.set_xticks([])
+        ax2.set_title('%s Tweet Volume vs Price Jan 2018 - Aug 2021' %
+                      search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/tweet_volume_price/%s_price_vs_tweet_extended.png' %
+                    (search_term))
 
 def price_vs_google_trend(chosen_dataframe, chosen_prices_dataframe, duration, search_term):
-    fig, ax1 = plt.subplots()
-    plt.xticks(rotation=45)
+    fig = new_figure()
+    ax1 = fig.add_subplot()
+    ax1.tick_params(axis='x', labelrotation=45)
     ax1.set_xlabel('Date')
     ax1.set_ylabel('Trend Interest', color='blue')
-    ax1.plot(chosen_dataframe.Date,
-             chosen_dataframe.Search_Volume, color='blue')
+    ax1.plot(*decimated(chosen_dataframe.Date,
+                        chosen_dataframe.Search_Volume, line_points(ax1)), color='blue')
     ax2 = ax1.twinx()
     ax2.set_ylabel('Close Price ($USD)', color='green')
-    ax2.plot(chosen_dataframe.Date,
-             chosen_prices_dataframe.Close, color='green')
+    ax2.plot(*decimated(chosen_dataframe.Date,
+                        chosen_prices_dataframe.Close, line_points(ax2)), color='green')
     fig.tight_layout()
     if duration == "snapshot":
-        plt.title('%s Google Trend Interest vs Price Mar 2021' %
-                  search_term.capitalize())
-        plt.savefig('../../output_data/plots/google_trend_price/%s_price_vs_google_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        ax2.set_title('%s Google Trend Interest vs Price Mar 2021' %
+                      search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/google_trend_price/%s_price_vs_google_snapshot.png' %
+                    (search_term))
     else:
-        plt.xticks([])
-        plt.title('%s Google Trend Interest vs Price Jan 2018 - Aug 2021' %
-                  search_term.capitalize())
-        plt.savefig('../../output_data/plots/google_trend_price/%s_price_vs_google_extended.png' %
-                    (search_term), bbox_inches='tight')
+        ax2.set_xticks([])
+        ax2.set_title('%s Google Trend Interest vs Price Jan 2018 - Aug 2021' %
+                      search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/google_trend_price/%s_price_vs_google_extended.png' %
+                    (search_term))
 
 def tweet_volume_graph(chosen_dataframe, duration, search_term):
-    chosen_dataframe.plot.line(x='Date', y='Tweets',  color='blue')
-    plt.xticks(rotation=45)
+    fig = new_figure()
+    ax = fig.add_subplot()
+    chosen_dataframe = chosen_dataframe.iloc[line_indices(chosen_dataframe.Date, chosen_dataframe.Tweets,
+                                                          line_points(ax))]
+    chosen_dataframe.plot.line(x='Date', y='Tweets',  color='blue', ax=ax)
+    ax.tick_params(axis='x', labelrotation=45)
     if duration == 'snapshot':
-        plt.title('%s Total Tweet Volume Mar 2021' % search_term.capitalize())
-        plt.savefig('../../output_data/plots/tweet_volume/%s_tweet_volume_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        ax.set_title('%s Total Tweet Volume Mar 2021' % search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/tweet_volume/%s_tweet_volume_snapshot.png' %
+                    (search_term))
     else:
-        plt.title('%s Total Tweet Volume 2018 - 2021' %
-                  search_term.capitalize())
-        plt.savefig('../../output_data/plots/tweet_volume/%s_tweet_volume_extended.png' %
-                    (search_term), bbox_inches='tight')
-
-def corr_graph(chosen_dataframe, duration, search_term):
-    correlation = chosen_dataframe.corr()
-    fig = plt.figure()
+        ax.set_title('%s Total Tweet Volume 2018 - 2021' %
+                     search_term.capitalize())
+        save_figure(fig, '../../output_data/plots/tweet_volume/%s_tweet_volume_extended.png' %
+                    (search_term))
+
+def corr_graph(results, duration, search_term):
+    correlation = correlation_matrix(results)
+    fig = new_figure()
     ax = fig.add_subplot(111)
     axis_parameters = ax.matshow(correlation, cmap='seismic', vmin=-1, vmax=1)
     fig.colorbar(axis_parameters)
-    tick_marks = np.arange(0, len(chosen_dataframe.columns), 1)
+    tick_marks = np.arange(0, len(correlation.columns), 1)
     ax.set_xticks(tick_marks)
     ax.set_yticks(tick_marks)
-    ax.set_xticklabels(chosen_dataframe.columns)
-    ax.set_yticklabels(chosen_dataframe.columns)
-    plt.xticks(rotation=45)
-    plt.title("%s Correlation HeatMap" % (search_term.capitalize()))
+    ax.set_xticklabels(correlation.columns)
+    ax.set_yticklabels(correlation.columns)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.set_title("%s Correlation HeatMap" % (search_term.capitalize()))
     if duration == "snapshot":
-        plt.savefig('../../output_data/plots/correlation/%s_correlation_snapshot.png' %
-                    (search_term), bbox_inches='tight')
+        save_figure(fig, '../../output_data/plots/correlation/%s_correlation_snapshot.png' %
+                    (search_term))
     else:
-        plt.savefig('../../output_data/plots/correlation/%s_correlation_extended.png' %
-                    (search_term), bbox_inches='tight')
+        save_figure(fig, '../../output_data/plots/correlation/%s_correlation_extended.png' %
+                    (search_term))
+
+def lag_correlation_graph(results, search_term):
+    table = lag_table(results)
+    fig = new_figure()
+    ax = fig.add_subplot()
+    for column in table.columns:
+        ax.plot(table.index, table[column], label=column)
+    ax.axhline(0, color='grey', linewidth=0.5)
+    ax.axvline(0, color='grey', linewidth=0.5)
+    ax.set_xlabel('Lag (days the variable leads the price)')
+    ax.set_ylabel('Correlation with Close Price')
+    ax.set_ylim(-1, 1)
+    ax.legend(fontsize='small')
+    ax.set_title("%s Lagged Correlation with Price Jan 2018 - Aug 2021" % (search_term.capitalize()))
+    save_figure(fig, '../../output_data/plots/correlation/%s_lag_correlation_extended.png' %
+                (search_term))
 
-# Coin Charts
 
-bitcoin_price_snapshot_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_snapshot.csv")
+def rolling_correlation_graph(results, search_term):
+    rolling = results['rolling'].dropna(axis=1, how='all')
+    fig = new_figure()
+    ax = fig.add_subplot()
+    ax.tick_params(axis='x', labelrotation=45)
+    for column in rolling.columns:
+        values = rolling[column].dropna()
+        ax.plot(*decimated(values.index, values, line_points(ax)), label=column)
+    ax.axhline(0, color='grey', linewidth=0.5)
+    ax.set_xlabel('January 2018 - August 2021')
+    ax.set_ylabel('Correlation with Close Price over the Last 30 Values')
+    ax.set_ylim(-1, 1)
+    ax.legend(fontsize='small')
+    ax.set_title("%s Rolling Correlation with Price Jan 2018 - Aug 2021" % (search_term.capitalize()))
+    save_figure(fig, '../../output_data/plots/correlation/%s_rolling_correlation_extended.png' %
+                (search_term))
+
+if __name__ == "__main__":
+    STORAGE = os.environ.get('SENTIMENT_STORAGE', 'csv')
+    FREQUENCY = os.environ.get('SENTIMENT_FREQUENCY', 'daily')
+    WORKERS = os.cpu_count()
+    CATALOG = DataCatalog(STORAGE)
+    charts = []
 
-bitcoin_price_extended_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_extended.csv")
+    # Coin Charts
 
-cardano_price_snapshot_df = pd.read_csv(
-    "../../input_data/cardano_cp_snapshot.csv")
+    bitcoin_price_snapshot_df = CATALOG.load(
+        "../../input_data/bitcoin_cp_snapshot.csv", 'prices')
 
-cardano_price_extended_df = pd.read_csv(
-    "../../input_data/cardano_cp_extended.csv")
+    bitcoin_price_extended_df = CATALOG.load(
+        "../../input_data/bitcoin_cp_extended.csv", 'prices')
+
+    cardano_price_snapshot_df = CATALOG.load(
+        "../../input_data/cardano_cp_snapshot.csv", 'prices')
 
-coin_prices(bitcoin_price_snapshot_df, "snapshot", "bitcoin")
-coin_prices(bitcoin_price_extended_df, "extended", "bitcoin")
-coin_prices(cardano_price_snapshot_df, "snapshot", "cardano")
-coin_prices(cardano_price_extended_df, "extended", "cardano")
+    cardano_price_extended_df = CATALOG.load(
+        "../../input_data/cardano_cp_extended.csv", 'prices')
 
-# Polarity Histograms
+    bitcoin_snapshot_prices = PricePyramid(bitcoin_price_snapshot_df)
+    bitcoin_extended_prices = PricePyramid(bitcoin_price_extended_df)
+    cardano_snapshot_prices = PricePyramid(cardano_price_snapshot_df)
+    cardano_extended_prices = PricePyramid(cardano_price_extended_df)
 
-bitcoin_cleaned_snapshot_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_snapshot.csv", lineterminator='\n')
-bitcoin_cleaned_snapshot_df['date'] = pd.to_datetime(
-    bitcoin_cleaned_snapshot_df['date'])
+    charts.append((coin_prices, (bitcoin_price_snapshot_df, "snapshot", "bitcoin")))
+    charts.append((coin_prices, (bitcoin_price_extended_df, "extended", "bitcoin")))
+    charts.append((coin_prices, (cardano_price_snapshot_df, "snapshot", "cardano")))
+    charts.append((coin_prices, (cardano_price_extended_df, "extended", "cardano")))
 
-bitcoin_cleaned_extended_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_extended.csv", lineterminator='\n')
-bitcoin_cleaned_extended_df['date'] = pd.to_datetime(
-    bitcoin_cleaned_extended_df['date'])
+    # Polarity Histograms
 
-cardano_cleaned_snapshot_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/cardano_cleaned_tweets_snapshot.csv", lineterminator='\n')
-cardano_cleaned_snapshot_df['date'] = pd.to_datetime(
-    cardano_cleaned_snapshot_df['date'])
+    bitcoin_cleaned_snapshot_df = CATALOG.load(
+        "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_snapshot.csv", 'cleaned_tweets', ['date', 'Polarity'])
 
-cardano_cleaned_extended_df = pd.read_csv(
-    "../../output_data/clean_tweet_data/cardano_cleaned_tweets_extended.csv", lineterminator='\n')
-cardano_cleaned_extended_df['date'] = pd.to_datetime(
-    cardano_cleaned_extended_df['date'])
+    bitcoin_cleaned_extended_df = CATALOG.load(
+        "../../output_data/clean_tweet_data/bitcoin_cleaned_tweets_extended.csv", 'cleaned_tweets', ['date', 'Polarity'])
 
-polarity_hist(bitcoin_cleaned_snapshot_df, "snapshot", "bitcoin")
-polarity_hist(bitcoin_cleaned_extended_df, "extended", "bitcoin")
-polarity_hist(cardano_cleaned_snapshot_df, "snapshot", "cardano")
-polarity_hist(cardano_cleaned_extended_df, "extended", "cardano")
+    cardano_cleaned_snapshot_df = CATALOG.load(
+        "../../output_data/clean_tweet_data/cardano_cleaned_tweets_snapshot.csv", 'cleaned_tweets', ['date', 'Polarity'])
 
-# Ojectivity vs Neutrality
+    cardano_cleaned_extended_df = CATALOG.load(
+        "../../output_data/clean_tweet_data/cardano_cleaned_tweets_extended.csv", 'cleaned_tweets', ['date', 'Polarity'])
 
-bitcoin_sentiment_snapshot_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/bitcoin_sentiment_dataframe_snapshot.csv", lineterminator='\n')
+    charts.append((polarity_hist, (bitcoin_cleaned_snapshot_df, "snapshot", "bitcoin")))
+    charts.append((polarity_hist, (bitcoin_cleaned_extended_df, "extended", "bitcoin")))
+    charts.append((polarity_hist, (cardano_cleaned_snapshot_df, "snapshot", "cardano")))
+    charts.append((polarity_hist, (cardano_cleaned_extended_df, "extended", "cardano")))
 
-bitcoin_sentiment_extended_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/bitcoin_sentiment_dataframe_extended.csv")
+    # Ojectivity vs Neutrality
 
-cardano_sentiment_snapshot_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/cardano_sentiment_dataframe_snapshot.csv", lineterminator='\n')
+    bitcoin_sentiment_snapshot_df = CATALOG.load(
+        sentiment_dataframe_path("bitcoin", "snapshot", FREQUENCY), 'sentiment')
 
-cardano_sentiment_extended_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/cardano_sentiment_dataframe_extended.csv")
+    bitcoin_sentiment_extended_df = CATALOG.load(
+        sentiment_dataframe_path("bitcoin", "extended", FREQUENCY), 'sentiment')
 
-objec_neut_bar(bitcoin_sentiment_snapshot_df, "snapshot", "bitcoin")
-objec_neut_bar(bitcoin_sentiment_extended_df, "extended", "bitcoin")
-objec_neut_bar(cardano_sentiment_snapshot_df, "snapshot", "cardano")
-objec_neut_bar(cardano_sentiment_extended_df, "extended", "cardano")
+    cardano_sentiment_snapshot_df = CATALOG.load(
+        sentiment_dataframe_path("cardano", "snapshot", FREQUENCY), 'sentiment')
 
-# Sentiment vs Price
+    cardano_sentiment_extended_df = CATALOG.load(
+        sentiment_dataframe_path("cardano", "extended", FREQUENCY), 'sentiment')
 
-bitcoin_sentiment_snapshot_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/bitcoin_sentiment_dataframe_snapshot.csv", lineterminator='\n')
+    charts.append((objec_neut_bar, (bitcoin_sentiment_snapshot_df, "snapshot", "bitcoin")))
+    charts.append((objec_neut_bar, (bitcoin_sentiment_extended_df, "extended", "bitcoin")))
+    charts.append((objec_neut_bar, (cardano_sentiment_snapshot_df, "snapshot", "cardano")))
+    charts.append((objec_neut_bar, (cardano_sentiment_extended_df, "extended", "cardano")))
 
-bitcoin_price_snapshot_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_snapshot.csv")
+    # Sentiment vs Price
 
-bitcoin_sentiment_extended_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/bitcoin_sentiment_dataframe_extended.csv")
+    bitcoin_sentiment_snapshot_df = CATALOG.load(
+        sentiment_dataframe_path("bitcoin", "snapshot", FREQUENCY), 'sentiment')
 
-bitcoin_price_month_extended_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_month_extended.csv")
+    bitcoin_price_snapshot_df = bitcoin_snapshot_prices.aligned(bitcoin_sentiment_snapshot_df.date)
 
-cardano_sentiment_snapshot_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/cardano_sentiment_dataframe_snapshot.csv", lineterminator='\n')
+    bitcoin_sentiment_extended_df = CATALOG.load(
+        sentiment_dataframe_path("bitcoin", "extended", FREQUENCY), 'sentiment')
 
-cardano_price_snapshot_df = pd.read_csv(
-    "../../input_data/cardano_cp_snapshot.csv")
+    bitcoin_price_month_extended_df = bitcoin_extended_prices.aligned(bitcoin_sentiment_extended_df.date, "monthly")
 
-cardano_sentiment_extended_df = pd.read_csv(
-    "../../output_data/sentiment_dataframes_csv/cardano_sentiment_dataframe_extended.csv")
+    cardano_sentiment_snapshot_df = CATALOG.load(
+        sentiment_dataframe_path("cardano", "snapshot", FREQUENCY), 'sentiment')
 
-cardano_price_month_extended_df = pd.read_csv(
-    "../../input_data/cardano_cp_month_extended.csv")
+    cardano_price_snapshot_df = cardano_snapshot_prices.aligned(cardano_sentiment_snapshot_df.date)
 
+    cardano_sentiment_extended_df = CATALOG.load(
+        sentiment_dataframe_path("cardano", "extended", FREQUENCY), 'sentiment')
 
-sentiment_price_graph(bitcoin_sentiment_snapshot_df,
-                      bitcoin_price_snapshot_df, "snapshot", "bitcoin")
-sentiment_price_graph(bitcoin_sentiment_extended_df,
-                      bitcoin_price_month_extended_df, "extended", "bitcoin")
-sentiment_price_graph(cardano_sentiment_snapshot_df,
-                      cardano_price_snapshot_df, "snapshot", "cardano")
-sentiment_price_graph(cardano_sentiment_extended_df,
-                      cardano_price_month_extended_df, "extended", "cardano")
+    cardano_price_month_extended_df = cardano_extended_prices.aligned(cardano_sentiment_extended_df.date, "monthly")
 
-# Tweet Volumes
 
-bitcoin_tweet_volume_snapshot_df = pd.read_csv(
-    "../../input_data/bitcoin_tv_snapshot.csv")
-bitcoin_tweet_volume_extended_df = pd.read_csv(
-    "../../input_data/bitcoin_tv_extended.csv")
-cardano_tweet_volume_snapshot_df = pd.read_csv(
-    "../../input_data/cardano_tv_snapshot.csv")
-cardano_tweet_volume_extended_df = pd.read_csv(
-    "../../input_data/cardano_tv_extended.csv")
+    charts.append((sentiment_price_graph, (bitcoin_sentiment_snapshot_df,
+                                           bitcoin_price_snapshot_df, "snapshot", "bitcoin")))
+    charts.append((sentiment_price_graph, (bitcoin_sentiment_extended_df,
+                                           bitcoin_price_month_extended_df, "extended", "bitcoin")))
+    charts.append((sentiment_price_graph, (cardano_sentiment_snapshot_df,
+                                           cardano_price_snapshot_df, "snapshot", "cardano")))
+    charts.append((sentiment_price_graph, (cardano_sentiment_extended_df,
+                                           cardano_price_month_extended_df, "extended", "cardano")))
 
-tweet_volume_graph(bitcoin_tweet_volume_snapshot_df, "snapshot", "bitcoin")
-tweet_volume_graph(bitcoin_tweet_volume_extended_df, "extended", "bitcoin")
-tweet_volume_graph(cardano_tweet_volume_snapshot_df, "snapshot", "cardano")
-tweet_volume_graph(cardano_tweet_volume_extended_df, "extended", "cardano")
+    # Tweet Volumes
 
-# Price vs Tweet Volume
+    bitcoin_tweet_volume_snapshot_df = CATALOG.load(
+        "../../input_data/bitcoin_tv_snapshot.csv", 'tweet_volume')
+    bitcoin_tweet_volume_extended_df = CATALOG.load(
+        "../../input_data/bitcoin_tv_extended.csv", 'tweet_volume')
+    cardano_tweet_volume_snapshot_df = CATALOG.load(
+        "../../input_data/cardano_tv_snapshot.csv", 'tweet_volume')
+    cardano_tweet_volume_extended_df = CATALOG.load(
+        "../../input_data/cardano_tv_extended.csv", 'tweet_volume')
 
-bitcoin_tweet_volume_snapshot_df = pd.read_csv(
-    "../../input_data/bitcoin_tv_snapshot.csv")
+    charts.append((tweet_volume_graph, (bitcoin_tweet_volume_snapshot_df, "snapshot", "bitcoin")))
+    charts.append((tweet_volume_graph, (bitcoin_tweet_volume_extended_df, "extended", "bitcoin")))
+    charts.append((tweet_volume_graph, (cardano_tweet_volume_snapshot_df, "snapshot", "cardano")))
+    charts.append((tweet_volume_graph, (cardano_tweet_volume_extended_df, "extended", "cardano")))
 
-bitcoin_price_snapshot_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_snapshot.csv")
+    # Price vs Tweet Volume
 
-bitcoin_tweet_volume_extended_df = pd.read_csv(
-    "../../input_data/bitcoin_tv_extended.csv")
+    bitcoin_tweet_volume_snapshot_df = CATALOG.load(
+        "../../input_data/bitcoin_tv_snapshot.csv", 'tweet_volume')
 
-bitcoin_price_extended_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_extended.csv")
+    bitcoin_price_snapshot_df = bitcoin_snapshot_prices.aligned(bitcoin_tweet_volume_snapshot_df.Date)
 
-cardano_tweet_volume_snapshot_df = pd.read_csv(
-    "../../input_data/cardano_tv_snapshot.csv")
+    bitcoin_tweet_volume_extended_df = CATALOG.load(
+        "../../input_data/bitcoin_tv_extended.csv", 'tweet_volume')
 
-cardano_price_snapshot_df = pd.read_csv(
-    "../../input_data/cardano_cp_snapshot.csv")
+    bitcoin_price_extended_df = bitcoin_extended_prices.aligned(bitcoin_tweet_volume_extended_df.Date)
 
-cardano_tweet_volume_extended_df = pd.read_csv(
-    "../../input_data/cardano_tv_extended.csv")
+    cardano_tweet_volume_snapshot_df = CATALOG.load(
+        "../../input_data/cardano_tv_snapshot.csv", 'tweet_volume')
 
-cardano_price_extended_df = pd.read_csv(
-    "../../input_data/cardano_cp_extended.csv")
+    cardano_price_snapshot_df = cardano_snapshot_prices.aligned(cardano_tweet_volume_snapshot_df.Date)
 
-price_vs_tweet_volume(bitcoin_tweet_volume_snapshot_df,
-                      bitcoin_price_snapshot_df, "snapshot", "bitcoin")
-price_vs_tweet_volume(bitcoin_tweet_volume_extended_df,
-                      bitcoin_price_extended_df, "extended", "bitcoin")
-price_vs_tweet_volume(cardano_tweet_volume_snapshot_df,
-                      cardano_price_snapshot_df, "snapshot", "cardano")
-price_vs_tweet_volume(cardano_tweet_volume_extended_df,
-                      cardano_price_extended_df, "extended", "cardano")
+    cardano_tweet_volume_extended_df = CATALOG.load(
+        "../../input_data/cardano_tv_extended.csv", 'tweet_volume')
 
+    cardano_price_extended_df = cardano_extended_prices.aligned(cardano_tweet_volume_extended_df.Date)
 
-# Price vs Google Trends
+    charts.append((price_vs_tweet_volume, (bitcoin_tweet_volume_snapshot_df,
+                                           bitcoin_price_snapshot_df, "snapshot", "bitcoin")))
+    charts.append((price_vs_tweet_volume, (bitcoin_tweet_volume_extended_df,
+                                           bitcoin_price_extended_df, "extended", "bitcoin")))
+    charts.append((price_vs_tweet_volume, (cardano_tweet_volume_snapshot_df,
+                                           cardano_price_snapshot_df, "snapshot", "cardano")))
+    charts.append((price_vs_tweet_volume, (cardano_tweet_volume_extended_df,
+                                           cardano_price_extended_df, "extended", "cardano")))
 
-bitcoin_google_trend_snapshot_df = pd.read_csv(
-    "../../input_data/bitcoin_gt_snapshot.csv")
 
-bitcoin_price_snapshot_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_snapshot.csv")
+    # Price vs Google Trends
 
-bitcoin_google_trend_extended_df = pd.read_csv(
-    "../../input_data/bitcoin_gt_extended.csv")
+    bitcoin_google_trend_snapshot_df = CATALOG.load(
+        "../../input_data/bitcoin_gt_snapshot.csv", 'google_trend')
 
-bitcoin_price_extended_df = pd.read_csv(
-    "../../input_data/bitcoin_cp_week_extended.csv")
+    bitcoin_price_snapshot_df = bitcoin_snapshot_prices.aligned(bitcoin_google_trend_snapshot_df.Date)
 
-cardano_google_trend_snapshot_df = pd.read_csv(
-    "../../input_data/cardano_gt_snapshot.csv")
+    bitcoin_google_trend_extended_df = CATALOG.load(
+        "../../input_data/bitcoin_gt_extended.csv", 'google_trend')
 
-cardano_price_snapshot_df = pd.read_csv(
-    "../../input_data/cardano_cp_snapshot.csv")
+    bitcoin_price_extended_df = bitcoin_extended_prices.aligned(bitcoin_google_trend_extended_df.Date, "W-SAT")
 
-cardano_google_trend_extended_df = pd.read_csv(
-    "../../input_data/cardano_gt_extended.csv")
+    cardano_google_trend_snapshot_df = CATALOG.load(
+        "../../input_data/cardano_gt_snapshot.csv", 'google_trend')
 
-cardano_price_extended_df = pd.read_csv(
-    "../../input_data/cardano_cp_week_extended.csv")
+    cardano_price_snapshot_df = cardano_snapshot_prices.aligned(cardano_google_trend_snapshot_df.Date)
 
-price_vs_google_trend(bitcoin_google_trend_snapshot_df,
-                      bitcoin_price_snapshot_df, "snapshot", "bitcoin")
-price_vs_google_trend(bitcoin_google_trend_extended_df,
-                      bitcoin_price_extended_df, "extended", "bitcoin")
-price_vs_google_trend(cardano_google_trend_snapshot_df,
-                      cardano_price_snapshot_df, "snapshot", "cardano")
-price_vs_google_trend(cardano_google_trend_extended_df,
-                      cardano_price_extended_df, "extended", "cardano")
+    cardano_google_trend_extended_df = CATALOG.load(
+        "../../input_data/cardano_gt_extended.csv", 'google_trend')
 
+    cardano_price_extended_df = cardano_extended_prices.aligned(cardano_google_trend_extended_df.Date, "W-SAT")
 
-corr_df = pd.read_csv(
-    "../../output_data/correlation_data/bitcoin_correlation.csv")
-corr_graph(corr_df, "snapshot", "bitcoin")
+    charts.append((price_vs_google_trend, (bitcoin_google_trend_snapshot_df,
+                                           bitcoin_price_snapshot_df, "snapshot", "bitcoin")))
+    charts.append((price_vs_google_trend, (bitcoin_google_trend_extended_df,
+                                           bitcoin_price_extended_df, "extended", "bitcoin")))
+    charts.append((price_vs_google_trend, (cardano_google_trend_snapshot_df,
+                                           cardano_price_snapshot_df, "snapshot", "cardano")))
+    charts.append((price_vs_google_trend, (cardano_google_trend_extended_df,
+                                           cardano_price_extended_df, "extended", "cardano")))
 
-corr_df = pd.read_csv(
-    "../../output_data/correlation_data/cardano_correlation.csv")
-corr_graph(corr_df, "snapshot", "cardano")
+
+    # Correlation Charts
+
+    bitcoin_correlation_snapshot = cached_correlations(CATALOG.load(
+        "../../output_data/correlation_data/bitcoin_correlation.csv", 'correlation').set_index('date'))
+
+    bitcoin_correlation_extended = cached_correlations(CATALOG.load(
+        "../../output_data/correlation_data/bitcoin_correlation_extended.csv", 'correlation').set_index('date'))
+
+    cardano_correlation_snapshot = cached_correlations(CATALOG.load(
+        "../../output_data/correlation_data/cardano_correlation.csv", 'correlation').set_index('date'))
+
+    cardano_correlation_extended = cached_correlations(CATALOG.load(
+        "../../output_data/correlation_data/cardano_correlation_extended.csv", 'correlation').set_index('date'))
+
+    charts.append((corr_graph, (bitcoin_correlation_snapshot, "snapshot", "bitcoin")))
+    charts.append((corr_graph, (bitcoin_correlation_extended, "extended", "bitcoin")))
+    charts.append((corr_graph, (cardano_correlation_snapshot, "snapshot", "cardano")))
+    charts.append((corr_graph, (cardano_correlation_extended, "extended", "cardano")))
+    charts.append((lag_correlation_graph, (bitcoin_correlation_extended, "bitcoin")))
+    charts.append((lag_correlation_graph, (cardano_correlation_extended, "cardano")))
+    charts.append((rolling_correlation_graph, (bitcoin_correlation_extended, "bitcoin")))
+    charts.append((rolling_correlation_graph, (cardano_correlation_extended, "cardano")))
+
+    print("Charts rendered ", render_charts(charts, WORKERS))
+    print("Data catalog ", CATALOG.report())
@@ -0,0 +1,161 @@
+import re
+from importlib.metadata import version
+import numpy as np
+import pandas as pd
+from textblob import TextBlob
+from textblob.en import sentiment as pattern_sentiment
+from textblob._text import find_tokens, EMOTICONS, PUNCTUATION
+from instrumentation import instrumented
+
+SCORE_TOLERANCE = 1e-12
+SCORER_VERSION = 'pattern-en-1/textblob-%s' % version('textblob')
+SYNSET_PATTERN = re.compile(r"^[acdnrv][-_][0-9]+$")
+
+
+def build_lexicon_index(lexicon=pattern_sentiment):
+    len(lexicon)
+    words = {}
+    for word, senses in dict.items(lexicon):
+        if None not in senses:
+            continue
+        polarity, subjectivity, intensity = senses[None]
+        modifier = any(pos in senses for pos in lexicon.modifiers)
+        words[word] = (float(polarity), float(subjectivity),
+                       float(intensity), modifier)
+    emoticons = {}
+    for (mood, polarity), faces in EMOTICONS.items():
+        for face in faces:
+            face = face.lower()
+            if face.isalpha() or len(face) > 5 or face in PUNCTUATION:
+                continue
+            emoticons.setdefault(face, float(polarity))
+    return {'words': words,
+            'emoticons': emoticons,
+            'negations': frozenset(lexicon.negations)}
+
+
+_lexicon_index = None
+
+
+def lexicon_index():
+    global _lexicon_index
+    if _lexicon_index is None:
+        _lexicon_index = build_lexicon_index()
+    return _lexicon_index
+
+def tweet_assessments(tweet, index):
+    words = index['words']
+    emoticons = index['emoticons']
+    negations = index['negations']
+    assessments = []
+    modifier = None
+    negation = None
+    for word in " ".join(find_tokens(tweet)).split():
+        word = word.lower()
+        entry = words.get(word)
+        if entry is not None:
+            polarity, subjectivity, intensity, is_modifier = entry
+            if modifier is None:
+                assessments.append([polarity, subjectivity, intensity, 1])
+            else:
+                last = assessments[-1]
+                last[0] = max(-1.0, min(polarity * last[2], 1.0))
+                last[1] = max(-1.0, min(subjectivity * last[2], 1.0))
+                last[2] = intensity
+            if negation is not None:
+                assessments[-1][2] = 1.0 / assessments[-1][2]
+                assessments[-1][3] = -1
+            modifier = word if is_modifier else None
+            negation = word if word in negations else None
+        else:
+            if word in negations:
+                negation = word
+            elif negation and len(word.strip("'")) > 1:
+                negation = None
+            if negation is not None and modifier is not None and modifier.endswith("ly"):
+                assessments[-1][3] = -1
+                negation = None
+            elif modifier and len(word) > 2:
+                modifier = None
+            if word == "!" and len(assessments) > 0:
+                assessments[-1][0] = max(-1.0,
+                                         min(assessments[-1][0] * 1.25, 1.0))
+            if word == "(!)":
+                assessments.append([0.0, 1.0, 1.0, 1])
+            if word in emoticons:
+                assessments.append([emoticons[word], 1.0, 1.0, 1])
+    return [(polarity * -0.5 if negated < 0 else polarity, subjectivity)
+            for polarity, subjectivity, intensity, negated in assessments]
+
+def sentiment_labels(polarity):
+    polarity = np.asarray(polarity, dtype=float)
+    return np.select([polarity < 0, polarity == 0],
+                     ['Negative', 'Neutral'], default='Positive')
+
+
+@instrumented
+def score_tweets(clean_tweets):
+    index = lexicon_index()
+    tweets = clean_tweets.tolist() if isinstance(clean_tweets, pd.Series) else list(clean_tweets)
+    total = len(tweets)
+    positions = []
+    polarities = []
+    subjectivities = []
+    fallback = {}
+    for position, tweet in enumerate(tweets):
+        if SYNSET_PATTERN.match(tweet):
+            fallback[position] = TextBlob(tweet).sentiment
+            continue
+        for polarity, subjectivity in tweet_assessments(tweet, index):
+            positions.append(position)
+            polarities.append(polarity)
+            subjectivities.append(subjectivity)
+    positions = np.asarray(positions, dtype=np.int64)
+    counts = np.bincount(positions, minlength=total)
+    counts = np.where(counts == 0, 1, counts).astype(float)
+    polarity = np.bincount(positions, weights=np.asarray(
+        polarities, dtype=float), minlength=total) / counts
+    subjectivity = np.bincount(positions, weights=np.asarray(
+        subjectivities, dtype=float), minlength=total) / counts
+    for position, score in fallback.items():
+        polarity[position] = score.polarity
+        subjectivity[position] = score.subjectivity
+    if isinstance(clean_tweets, pd.Series):
+        scores_index = clean_tweets.index
+    else:
+        scores_index = None
+    scores = pd.DataFrame({'Subjectivity': subjectivity,
+                           'Polarity': polarity}, index=scores_index)
+    scores['Sentiment'] = sentiment_labels(polarity)
+    return scores
+
+def score_tweet(clean_tweet, index=None):
+    if SYNSET_PATTERN.match(clean_tweet):
+        score = TextBlob(clean_tweet).sentiment
+        return score.polarity, score.subjectivity
+    assessments = tweet_assessments(clean_tweet, index or lexicon_index())
+    if not assessments:
+        return 0.0, 0.0
+    polarity = 0.0
+    subjectivity = 0.0
+    for word_polarity, word_subjectivity in assessments:
+        polarity += word_polarity
+        subjectivity += word_subjectivity
+    return polarity / len(assessments), subjectivity / len(assessments)
+
+
+def sentiment_label(polarity):
+    if polarity < 0:
+        return 'Negative'
+    elif polarity == 0:
+        return 'Neutral'
+    return 'Positive'
+
+def textblob_deviation(clean_tweets):
+    scores = score_tweets(clean_tweets)
+    reference = [TextBlob(tweet).sentiment for tweet in clean_tweets]
+    polarity = np.array([score.polarity for score in reference], dtype=float)
+    subjectivity = np.array(
+        [score.subjectivity for score in reference], dtype=float)
+    return {'polarity': float(np.max(np.abs(scores['Polarity'].to_numpy() - polarity), initial=0.0)),
+            'subjectivity': float(np.max(np.abs(scores['Subjectivity'].to_numpy() - subjectivity), initial=0.0))}
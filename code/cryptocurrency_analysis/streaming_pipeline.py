@@ -0,0 +1,78 @@
+import io
+import pandas as pd
+from parallel_update import clean_and_score_tweets, DEFAULT_CHUNK_SIZE
+from sentiment_aggregation import sentiment_partial_sums, combine_partial_sums, sentiment_frame_from_sums, intraday
+
+RAW_COLUMNS = ['date', 'tweet', 'language']
+DEFAULT_READ_ROWS = 200000
+SCAN_BYTES = 1 << 20
+
+
+class ByteRange(io.RawIOBase):
+    def __init__(self, raw_file, end):
+        self.raw_file = raw_file
+        self.end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.raw_file.read(max(min(len(buffer), self.end - self.raw_file.tell()), 0))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def complete_rows_end(raw_csv_path, offset, end):
+    reached = offset
+    quotes = 0
+    with open(raw_csv_path, 'rb') as raw_csv:
+        raw_csv.seek(offset)
+        position = offset
+        while position < end:
+            block = raw_csv.read(min(SCAN_BYTES, end - position))
+            if not block:
+                break
+            line_end = block.rfind(b'\n')
+            while line_end >= 0 and (quotes + block.count(b'"', 0, line_end)) % 2:
+                line_end = block.rfind(b'\n', 0, line_end)
+            if line_end >= 0:
+                reached = position + line_end + 1
+            quotes += block.count(b'"')
+            position += len(block)
+    return reached
+
+
+def raw_tweet_chunks(raw_csv_path, read_rows=DEFAULT_READ_ROWS, language='en', columns=RAW_COLUMNS,
+                     offset=0, end=None):
+    with open(raw_csv_path, 'rb') as raw_csv:
+        header = raw_csv.readline()
+        raw_csv.seek(max(offset, len(header)))
+        rows = raw_csv if end is None else io.BufferedReader(ByteRange(raw_csv, end))
+        if not rows.peek(1):
+            return
+        names = list(pd.read_csv(io.BytesIO(header)).columns)
+        for chunk in pd.read_csv(rows, header=None, names=names, usecols=columns, chunksize=read_rows):
+            chunk = chunk[chunk['language'] == language]
+            if len(chunk.index) > 0:
+                yield chunk
+
+def stream_sentiment_sums(raw_csv_path, read_rows=DEFAULT_READ_ROWS, workers=1,
+                          chunk_size=DEFAULT_CHUNK_SIZE, cache=None, language='en', frequency='daily',
+                          offset=0, end=None):
+    columns = RAW_COLUMNS + ['time'] if intraday(frequency) else RAW_COLUMNS
+    totals = None
+    for chunk in raw_tweet_chunks(raw_csv_path, read_rows, language, columns, offset, end):
+        processed = clean_and_score_tweets(
+            chunk['tweet'], workers, chunk_size, cache)
+        processed['date'] = chunk['date']
+        if 'time' in chunk.columns:
+            processed['time'] = chunk['time']
+        totals = combine_partial_sums(
+            [totals, sentiment_partial_sums(processed, frequency)])
+    return combine_partial_sums([totals])
+
+
+def stream_sentiment_dataframe(raw_csv_path, read_rows=DEFAULT_READ_ROWS, workers=1,
+                               chunk_size=DEFAULT_CHUNK_SIZE, cache=None, language='en', frequency='daily'):
+    return sentiment_frame_from_sums(stream_sentiment_sums(
+        raw_csv_path, read_rows, workers, chunk_size, cache, language, frequency))
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+WORDS = {
+    'en': ['bitcoin', 'cardano', 'crypto', 'price', 'market', 'buy', 'sell', 'hodl', 'moon', 'pump', 'dump',
+           'today', 'now', 'wen', 'to', 'the', 'is', 'a', 'this', 'just', 'staking', 'wallet', 'chart',
+           'great', 'good', 'bad', 'terrible', 'amazing', 'best', 'worst', 'not', 'very', 'really', 'happy',
+           'sad', 'bullish', 'bearish', 'new', 'high', 'low', 'big', 'crazy', 'love', 'hate', 'free', 'sure'],
+    'es': ['precio', 'mercado', 'comprar', 'vender', 'hoy', 'ahora', 'muy', 'bueno', 'malo', 'cripto', 'luna'],
+    'de': ['preis', 'markt', 'kaufen', 'verkaufen', 'heute', 'jetzt', 'sehr', 'gut', 'schlecht', 'krypto'],
+    'fr': ['prix', 'marché', 'acheter', 'vendre', "aujourd'hui", 'maintenant', 'très', 'bon', 'mauvais'],
+    'pt': ['preço', 'mercado', 'comprar', 'vender', 'hoje', 'agora', 'muito', 'bom', 'ruim', 'cripto'],
+    'ja': ['ビットコイン', '価格', '市場', '買う', '売る', '今日', '今', 'とても', '良い', '悪い'],
+    'und': [],
+}
+LANGUAGE_SHARES = {'en': 0.8, 'es': 0.05, 'de': 0.03, 'fr': 0.03, 'pt': 0.02, 'ja': 0.02, 'und': 0.05}
+HASHTAGS = ['#Bitcoin', '#bitcoin', '#Cardano', '#cardano', '#BTC', '#ADA', '#crypto', '#HODL', '#altcoin',
+            '#Bitcoin2021', '#cardanocommunity', '#DeFi', '#NFT', '#blockchain']
+EMOJI = ['🚀', '🌕', '💎', '🙌', '📈', '📉', '🔥', '😂', '😭']
+SENTENCES_PER_LANGUAGE = 5000
+USERS = 20000
+
+def random_codes(generator, count, length):
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'))
+    codes = letters[generator.integers(0, len(letters), (count, length))]
+    return np.array([''.join(code) for code in codes], dtype=object)
+
+
+def sentence_pools(generator):
+    pools = {}
+    for language, words in WORDS.items():
+        if not words:
+            pools[language] = np.array([''], dtype=object)
+            continue
+        lengths = generator.integers(3, 16, SENTENCES_PER_LANGUAGE)
+        words = np.array(words, dtype=object)
+        pools[language] = np.array([' '.join(words[generator.integers(0, len(words), length)])
+                                    for length in lengths], dtype=object)
+    return pools
+
+
+def decorations(generator, rows, choices, share):
+    chosen = np.full(rows, '', dtype=object)
+    used = generator.random(rows) < share
+    chosen[used] = np.asarray(choices, dtype=object)[generator.integers(0, len(choices), used.sum())]
+    return chosen
+
+
+def tweet_text(generator, pools, languages, usernames):
+    rows = len(languages)
+    text = np.empty(rows, dtype=object)
+    for language, pool in pools.items():
+        chosen = languages == language
+        text[chosen] = pool[generator.integers(0, len(pool), chosen.sum())]
+    mentions = decorations(generator, rows, ['@' + username + ' ' for username in usernames[:500]], 0.25)
+    hashtags = decorations(generator, rows, [' ' + tag for tag in HASHTAGS], 0.9)
+    more_hashtags = decorations(generator, rows, [' ' + tag for tag in HASHTAGS], 0.4)
+    urls = decorations(generator, rows, [' https://t.co/' + code
+                                         for code in random_codes(generator, 1000, 10)], 0.3)
+    line_breaks = decorations(generator, rows, ['\n'], 0.05)
+    emoji = decorations(generator, rows, [' ' + symbol for symbol in EMOJI], 0.2)
+    return mentions + text + line_breaks + hashtags + more_hashtags + emoji + urls
+
+DEFAULT_CHUNK_SIZE = 100000
+PERIOD = ('2018-01-01', '2021-08-31')
+
+
+def synthetic_tweet_chunks(rows, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, columns=None, duplicate_share=0.03):
+    generator = np.random.default_rng(seed)
+    pools = sentence_pools(generator)
+    usernames = random_codes(generator, USERS, 8)
+    languages = np.array(list(LANGUAGE_SHARES), dtype=object)
+    shares = np.array(list(LANGUAGE_SHARES.values()))
+    start, end = pd.Timestamp(PERIOD[0]).value // 10**9, pd.Timestamp(PERIOD[1]).value // 10**9 + 86399
+    next_id = 1360000000000000000
+    for chunk_start in range(0, rows, chunk_size):
+        size = min(chunk_size, rows - chunk_start)
+        seconds = np.sort(start + (end - start) * np.sqrt(generator.random(size))).astype('int64')
+        timestamps = pd.to_datetime(seconds, unit='s')
+        ids = next_id + np.arange(size, dtype='int64') * 1000 + generator.integers(0, 1000, size)
+        next_id += size * 1000
+        users = generator.integers(0, USERS, size)
+        chunk_languages = languages[generator.choice(len(languages), size, p=shares)]
+        text = tweet_text(generator, pools, chunk_languages, usernames)
+        chunk = pd.DataFrame({
+            'id': ids,
+            'conversation_id': ids,
+            'created_at': seconds * 1000,
+            'date': timestamps.strftime('%Y-%m-%d'),
+            'time': timestamps.strftime('%H:%M:%S'),
+            'timezone': '+0000',
+            'user_id': 1000000 + users,
+            'username': usernames[users],
+            'tweet': text,
+            'language': chunk_languages,
+            'replies_count': generator.poisson(1.5, size),
+            'retweets_count': generator.poisson(3, size),
+            'likes_count': generator.poisson(10, size),
+        })
+        for share_columns in [list(chunk.columns), ['tweet', 'language']]:
+            copies = np.flatnonzero(generator.random(size) < duplicate_share)
+            copies = copies[copies > 0]
+            originals = (generator.random(len(copies)) * copies).astype('int64')
+            for column in share_columns:
+                values = chunk[column].to_numpy(copy=True)
+                values[copies] = values[originals]
+                chunk[column] = values
+        if columns is not None:
+            chunk = chunk[columns]
+        yield chunk
+
+
+def synthetic_tweets(rows, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, columns=None, duplicate_share=0.03):
+    return pd.concat(synthetic_tweet_chunks(rows, seed, chunk_size, columns, duplicate_share),
+                     ignore_index=True)
+
+
+def write_synthetic_csv(csv_path, rows, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    for position, chunk in enumerate(synthetic_tweet_chunks(rows, seed, chunk_size, columns)):
+        chunk.to_csv(csv_path, mode='w' if position == 0 else 'a', header=position == 0, index=False)
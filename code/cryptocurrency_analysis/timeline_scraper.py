@@ -0,0 +1,161 @@
+import os
+import time
+import shutil
+import asyncio
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from instrumentation import instrumented
+
+try:
+    import twint
+except ImportError:
+    twint = None
+
+WINDOW_DIRECTORY = '../../output_data/raw_tweet_data/windows'
+WINDOW_TWEET_LIMIT = 5000
+
+
+def monthly_windows(years, months):
+    return [('20%s-%s-01' % (year, month), '20%s-%s-02' % (year, month))
+            for year in years for month in months]
+
+
+def window_path(coin, since, directory=WINDOW_DIRECTORY):
+    return os.path.join(directory, '%s_%s.csv' % (coin, since))
+
+
+def window_config(search_term, since, until, output, limit=WINDOW_TWEET_LIMIT):
+    if twint is not None:
+        coin_search = twint.Config()
+    else:
+        coin_search = SimpleNamespace()
+    coin_search.Search = search_term
+    coin_search.Store_csv = True
+    coin_search.Hide_output = True
+    coin_search.Limit = limit
+    coin_search.Count = True
+    coin_search.Output = output
+    coin_search.Since = since
+    coin_search.Until = until
+    return coin_search
+
+class RateLimiter:
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self.next_start = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+DEFAULT_SCRAPE_WORKERS = 4
+DEFAULT_MIN_INTERVAL = 2.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 5.0
+
+
+def run_search(search, config):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        search(config)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+@instrumented
+def scrape_window(search_term, coin, window, search, limiter, directory=WINDOW_DIRECTORY,
+                  retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, limit=WINDOW_TWEET_LIMIT):
+    since, until = window
+    path = window_path(coin, since, directory)
+    if os.path.exists(path):
+        return 'skipped'
+    part_path = path + '.part'
+    for attempt in range(retries + 1):
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        limiter.wait()
+        try:
+            run_search(search, window_config(search_term, since, until, part_path, limit))
+            break
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * 2 ** attempt)
+    if not os.path.exists(part_path):
+        open(part_path, 'w').close()
+    os.replace(part_path, path)
+    return 'done'
+
+def scrape_timeline(search_term, coin, windows, directory=WINDOW_DIRECTORY, workers=DEFAULT_SCRAPE_WORKERS,
+                    min_interval=DEFAULT_MIN_INTERVAL, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                    limit=WINDOW_TWEET_LIMIT, search=None):
+    if search is None:
+        if twint is None:
+            raise ImportError('twint is needed to scrape Twitter, or pass a search function such as CannedSearch')
+        search = twint.run.Search
+    os.makedirs(directory, exist_ok=True)
+    limiter = RateLimiter(min_interval)
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(scrape_window, search_term, coin, window, search, limiter,
+                                   directory, retries, backoff, limit): window
+                   for window in windows}
+        for future in as_completed(futures):
+            since = futures[future][0]
+            if future.exception() is None:
+                results[since] = future.result()
+            else:
+                results[since] = 'failed'
+                print('Window %s for %s failed: %r' % (since, search_term, future.exception()))
+    return {since: results[since] for since, until in windows}
+
+
+def combine_windows(coin, windows, output_path, directory=WINDOW_DIRECTORY):
+    paths = [window_path(coin, since, directory) for since, until in windows]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise RuntimeError('%d windows have not been scraped yet (%s), run the scrape again to resume'
+                           % (len(missing), ', '.join(missing)))
+    header = None
+    with open(output_path + '.part', 'wb') as output_file:
+        for path in paths:
+            with open(path, 'rb') as window_file:
+                window_header = window_file.readline()
+                if not window_header:
+                    continue
+                if header is None:
+                    header = window_header
+                    output_file.write(header)
+                shutil.copyfileobj(window_file, output_file)
+    os.replace(output_path + '.part', output_path)
+    return output_path
+
+class CannedSearch:
+    def __init__(self, canned_tweets, delay=0, failures=None):
+        self.canned_tweets = canned_tweets
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, config):
+        with self.lock:
+            self.calls.append(config.Since)
+            if self.failures.get(config.Since, 0) > 0:
+                self.failures[config.Since] -= 1
+                raise ConnectionError('Canned search failure for %s' % config.Since)
+        time.sleep(self.delay)
+        dates = self.canned_tweets['date'].astype(str)
+        window = self.canned_tweets[(dates >= config.Since) & (dates < config.Until)]
+        if config.Limit is not None:
+            window = window.head(config.Limit)
+        if len(window.index) > 0:
+            window.to_csv(config.Output, mode='a', index=False, header=not os.path.exists(config.Output))
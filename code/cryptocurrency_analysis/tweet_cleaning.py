@@ -0,0 +1,89 @@
+import re
+from functools import lru_cache
+import pandas as pd
+from instrumentation import instrumented
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+COIN_TAGS = {
+    '#Bitcoin': 'Bitcoin',
+    '#Cardano': 'Cardano',
+    '#bitcoin': 'bitcoin',
+    '#cardano': 'cardano',
+}
+
+
+def folded_coin_words(coin_tags):
+    words = []
+    for tag, replacement in coin_tags:
+        if not re.fullmatch('#[A-Za-z0-9]+', tag) or replacement != tag[1:]:
+            return None
+        words.append(replacement)
+    for word in words:
+        for other_word in words:
+            if word != other_word and other_word.startswith(word):
+                return None
+    return words
+
+URL_PATTERN = re.compile(r'https\S+')
+PYTHON_WHITESPACE = (r'\t\n\x{0b}\f\r \x{1c}-\x{1f}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}'
+                     r'\x{202f}\x{205f}\x{3000}')
+ARROW_URL_PATTERN = r'https[^%s]+' % (PYTHON_WHITESPACE)
+
+
+@lru_cache(maxsize=None)
+def cleaning_patterns(coin_tags):
+    words = folded_coin_words(coin_tags)
+    if not words:
+        return {'replacements': () if words is not None else coin_tags,
+                'pattern': re.compile(r'#[A-Za-z0-9]+|@[A-Za-z0-9]+|\n'),
+                'arrow_pattern': r'#[A-Za-z0-9]+|@[A-Za-z0-9]+|\n',
+                'arrow_replacement': ''}
+    coin = '(?=%s)' % '|'.join(re.escape(word) for word in words)
+    pattern = re.compile(
+        r'#(?!%(coin)s)(?:#%(coin)s|[A-Za-z0-9])+|@(?:#%(coin)s|[A-Za-z0-9])+|#%(coin)s|\n'
+        % {'coin': coin})
+    coin = '|'.join(words)
+    arrow_pattern = (r'#(%(coin)s)|#(?:#(?:%(coin)s)|[A-Za-z0-9])+|@(?:#(?:%(coin)s)|[A-Za-z0-9])+|\n'
+                     % {'coin': coin})
+    return {'replacements': (), 'pattern': pattern, 'arrow_pattern': arrow_pattern,
+            'arrow_replacement': r'\1'}
+
+TWEET_SEPARATOR = '\x1e'
+
+
+def clean_tweet_text(original_tweet, coin_tags=COIN_TAGS):
+    patterns = cleaning_patterns(tuple(coin_tags.items()))
+    for tag, replacement in patterns['replacements']:
+        original_tweet = original_tweet.replace(tag, replacement)
+    original_tweet = patterns['pattern'].sub('', original_tweet)
+    return URL_PATTERN.sub('', original_tweet)
+
+
+def arrow_clean_tweets(tweets, coin_tags=COIN_TAGS):
+    patterns = cleaning_patterns(tuple(coin_tags.items()))
+    for tag, replacement in patterns['replacements']:
+        tweets = pc.replace_substring(tweets, tag, replacement)
+    tweets = pc.replace_substring_regex(tweets, patterns['arrow_pattern'], patterns['arrow_replacement'])
+    return pc.replace_substring_regex(tweets, ARROW_URL_PATTERN, '')
+
+
+@instrumented
+def clean_tweets(original_tweets, coin_tags=COIN_TAGS):
+    index = original_tweets.index if isinstance(original_tweets, pd.Series) else None
+    if pa is not None:
+        cleaned = arrow_clean_tweets(pa.array(original_tweets, type=pa.large_string()), coin_tags)
+        return pd.Series(cleaned, index=index, dtype='str')
+    tweets = list(original_tweets)
+    joined = TWEET_SEPARATOR.join(tweets)
+    if len(tweets) == 0:
+        cleaned = []
+    elif joined.count(TWEET_SEPARATOR) != len(tweets) - 1:
+        cleaned = [clean_tweet_text(tweet, coin_tags) for tweet in tweets]
+    else:
+        cleaned = clean_tweet_text(joined, coin_tags).split(TWEET_SEPARATOR)
+    return pd.Series(cleaned, index=index, dtype=object)
@@ -0,0 +1,95 @@
+import os
+import pandas as pd
+from columnar_storage import STORAGE_FORMATS, write_frame, read_frame, storage_path
+from streaming_pipeline import DEFAULT_READ_ROWS
+from timeline_scraper import WINDOW_DIRECTORY, window_path
+from instrumentation import instrumented
+
+TWEET_STORE_DIRECTORY = '../../output_data/tweet_store'
+
+
+def partition_path(coin, date, directory=TWEET_STORE_DIRECTORY):
+    return os.path.join(directory, coin, date[:7], '%s.csv' % (date))
+
+
+def store_date(date):
+    return pd.Timestamp(date).strftime('%Y-%m-%d')
+
+
+def partition_dates(coin, since=None, until=None, directory=TWEET_STORE_DIRECTORY, storage='csv'):
+    coin_directory = os.path.join(directory, coin)
+    if not os.path.isdir(coin_directory):
+        return []
+    if since is not None:
+        since = store_date(since)
+    if until is not None:
+        until = store_date(until)
+    extension = STORAGE_FORMATS[storage]
+    dates = []
+    for month in sorted(os.listdir(coin_directory)):
+        if since is not None and month < since[:7]:
+            continue
+        if until is not None and month > until[:7]:
+            continue
+        for name in sorted(os.listdir(os.path.join(coin_directory, month))):
+            if not name.endswith(extension) or '.part' in name:
+                continue
+            date = name[:-len(extension)]
+            if (since is None or date >= since) and (until is None or date < until):
+                dates.append(date)
+    return dates
+
+def add_tweets(tweets, coin, directory=TWEET_STORE_DIRECTORY, storage='csv'):
+    days = pd.to_datetime(tweets['date']).dt.strftime('%Y-%m-%d')
+    written = 0
+    for date, day_tweets in tweets.groupby(days, sort=True):
+        csv_path = partition_path(coin, date, directory)
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        if os.path.exists(storage_path(csv_path, storage)):
+            day_tweets = pd.concat([read_frame(csv_path, storage=storage), day_tweets], ignore_index=True)
+        if 'id' in day_tweets.columns:
+            day_tweets = day_tweets.drop_duplicates('id', keep='last')
+        part_path = os.path.splitext(csv_path)[0] + '.part.csv'
+        write_frame(day_tweets, part_path, storage)
+        os.replace(storage_path(part_path, storage), storage_path(csv_path, storage))
+        written += 1
+    return written
+
+
+def add_raw_csv(raw_csv_path, coin, directory=TWEET_STORE_DIRECTORY, storage='csv', read_rows=DEFAULT_READ_ROWS):
+    if os.path.getsize(raw_csv_path) == 0:
+        return 0
+    written = 0
+    for chunk in pd.read_csv(raw_csv_path, chunksize=read_rows):
+        written += add_tweets(chunk, coin, directory, storage)
+    return written
+
+
+@instrumented
+def store_windows(coin, windows, directory=TWEET_STORE_DIRECTORY, storage='csv',
+                  window_directory=WINDOW_DIRECTORY):
+    paths = [window_path(coin, since, window_directory) for since, until in windows]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise RuntimeError('%d windows have not been scraped yet (%s), run the scrape again to resume'
+                           % (len(missing), ', '.join(missing)))
+    return sum(add_raw_csv(path, coin, directory, storage) for path in paths)
+
+def read_partitions(coin, dates, columns=None, directory=TWEET_STORE_DIRECTORY, storage='csv'):
+    partitions = [read_frame(partition_path(coin, date, directory), columns, storage) for date in dates]
+    if not partitions:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(partitions, ignore_index=True)
+
+
+@instrumented
+def read_tweets(coin, since=None, until=None, columns=None, directory=TWEET_STORE_DIRECTORY, storage='csv'):
+    dates = partition_dates(coin, since, until, directory, storage)
+    return read_partitions(coin, dates, columns, directory, storage)
+
+
+def read_windows(coin, windows, columns=None, directory=TWEET_STORE_DIRECTORY, storage='csv'):
+    dates = set()
+    for since, until in windows:
+        dates.update(partition_dates(coin, since, until, directory, storage))
+    return read_partitions(coin, sorted(dates), columns, directory, storage)